@@ -108,12 +108,15 @@ class CommandProcessor:
         self.log = log or []
         self.cmd_patterns: list[tuple[re.Pattern[str], str, str]] = []
         self.reverse_cmds: dict[str, tuple[str, str]] = {}
+        self._cmd_buckets: dict[str, list[tuple[re.Pattern[str], str, str]]] = {}
+        self._cmd_fallback: list[tuple[re.Pattern[str], str, str]] = []
         self._build_cmd_patterns()
         cfg = getattr(language, "llm_config", {}) or {}
         arts = cfg.get("ignore_articles") or []
         contr = cfg.get("ignore_contractions") or []
         self._ignore_articles: set[str] = {str(a).casefold() for a in arts}
         self._ignore_contractions: set[str] = {str(c).casefold() for c in contr}
+        self._ignore_tokens = frozenset(self._ignore_articles | self._ignore_contractions)
         self._last_duration: int | None = None
         self._dialog_npc: str | None = None
         self._dialog_node: str | None = None
@@ -138,15 +141,18 @@ class CommandProcessor:
         self.io.output = capture
         parse_ok: bool | None = None
         try:
-            for pattern, cmd_key, _ in self.cmd_patterns:
+            words = raw.split(None, 1)
+            candidates = self._cmd_buckets.get(words[0], self._cmd_fallback) if words else self._cmd_fallback
+            for pattern, cmd_key, _ in candidates:
                 match = pattern.fullmatch(raw)
                 if not match:
                     continue
                 groups = match.groupdict()
                 handler = getattr(self, f"cmd_{cmd_key}", self.cmd_unknown)
                 info = self.command_info.get(cmd_key, {})
-                args_preview = {k: v for k, v in groups.items() if v}
-                self.world.debug(f"command {cmd_key} args {args_preview}")
+                if self.world.debug_enabled:
+                    args_preview = {k: v for k, v in groups.items() if v}
+                    self.world.debug(f"command {cmd_key} args {args_preview}")
                 arg_count = info.get("arguments", 0)
                 ok = True
                 if arg_count == 2:
@@ -218,6 +224,22 @@ class CommandProcessor:
         pattern = re.compile(r"^show_log(?:\s+(?P<a>\d+))?$")
         self.cmd_patterns.append((pattern, "show_log", "show_log"))
         self.reverse_cmds["show_log"] = ("show_log", "show_log")
+        self._index_cmd_patterns()
+
+    def _index_cmd_patterns(self) -> None:
+        """Bucket ``cmd_patterns`` by their leading literal word, keeping match order.
+
+        Patterns starting with a placeholder land in every bucket and in the fallback list.
+        """
+        firsts: list[str | None] = []
+        for _pattern, _key, entry in self.cmd_patterns:
+            tokens = entry.split()
+            firsts.append(tokens[0] if tokens and tokens[0] not in ("$a", "$b") else None)
+        self._cmd_fallback = [p for p, first in zip(self.cmd_patterns, firsts, strict=True) if first is None]
+        self._cmd_buckets = {
+            word: [p for p, first in zip(self.cmd_patterns, firsts, strict=True) if first in (word, None)]
+            for word in {first for first in firsts if first is not None}
+        }
 
     def _compile_command(self, pattern: str, optional: bool) -> tuple[re.Pattern[str], str]:
         tokens = pattern.split()
@@ -248,7 +270,7 @@ class CommandProcessor:
 
     def _strip_leading_tokens(self, text: str) -> str:
         parts = text.strip().split()
-        while parts and parts[0].casefold() in (self._ignore_articles | self._ignore_contractions):
+        while parts and parts[0].casefold() in self._ignore_tokens:
             parts.pop(0)
         return " ".join(parts)
 
@@ -256,18 +278,11 @@ class CommandProcessor:
         if not name:
             return None
         name = self._strip_leading_tokens(name)
-        name_cf = name.casefold()
         if not in_inventory:
-            room = self.world.rooms[self.world.current]
-            for item_id in room.get("items", []):
-                names = self.world.item_names(item_id)
-                if any(n.casefold() == name_cf for n in names):
-                    return item_id
-        for item_id in self.world.inventory:
-            names = self.world.item_names(item_id)
-            if any(n.casefold() == name_cf for n in names):
+            item_id = self.world.find_room_item(name)
+            if item_id:
                 return item_id
-        return None
+        return self.world.find_inventory_item(name)
 
     def _find_npc_id(self, name: str) -> str | None:
         if not name:
@@ -280,11 +295,10 @@ class CommandProcessor:
             if not npc:
                 continue
             # respect visibility preconditions
-            pre = npc.get("meet", {}).get("preconditions")
+            pre = npc.meet.get("preconditions")
             if pre and not self.world.check_preconditions(pre):
                 continue
-            names = npc.get("names", [])
-            if any(n.casefold() == name_cf for n in names):
+            if name_cf in npc.names_cf:
                 return npc_id
         return None
 
@@ -299,17 +313,16 @@ class CommandProcessor:
             self.io.output(self.language_manager.messages["use_failure"])
             self.check_end()
             return
-        self.world.inventory.remove(item_id)
-        self.world.debug(f"inventory {self.world.inventory}")
+        self.world.remove_from_inventory(item_id)
         # Prefer article-aware message if configured
         messages = self.language_manager.messages
         art_key = f"{cfg.message_key}_article"
         if art_key in messages:
             item_obj = self.world.items.get(item_id)
             names = self.world.item_names(item_id)
-            name_acc = (getattr(item_obj, "forms", {}) or {}).get("acc") if item_obj else None
+            name_acc = (item_obj.forms or {}).get("acc") if item_obj else None
             name_to_use = name_acc or (names[0] if names else item_name)
-            article = (getattr(item_obj, "articles", {}) or {}).get("acc") if item_obj else None
+            article = (item_obj.articles or {}).get("acc") if item_obj else None
             if article:
                 self.io.output(messages[art_key].format(article=article, name=name_to_use))
             else:
@@ -355,7 +368,7 @@ class CommandProcessor:
                 continue
             effect = action.effect or {}
             self.world.apply_effect(effect)
-            dur = getattr(action, "duration", None)
+            dur = action.duration
             if dur is not None:
                 try:
                     self._last_duration = int(dur)
@@ -375,7 +388,7 @@ class CommandProcessor:
         if not item_id:
             self.io.output(self.language_manager.messages["item_not_present"])
             return
-        desc = self.world.describe_item(item_name)
+        desc = self.world.item_description(item_id)
         if desc:
             self.io.output(desc)
         self._execute_action("examine", item_id)
@@ -416,9 +429,9 @@ class CommandProcessor:
             if "taken_article" in messages and item_id_final:
                 item_obj = self.world.items.get(item_id_final)
                 names = self.world.item_names(item_id_final)
-                name_acc = (getattr(item_obj, "forms", {}) or {}).get("acc") if item_obj else None
+                name_acc = (item_obj.forms or {}).get("acc") if item_obj else None
                 name_to_use = name_acc or (names[0] if names else taken)
-                article = (getattr(item_obj, "articles", {}) or {}).get("acc") if item_obj else None
+                article = (item_obj.articles or {}).get("acc") if item_obj else None
                 if article:
                     self.io.output(messages["taken_article"].format(article=article, name=name_to_use))
                 else:
@@ -447,9 +460,9 @@ class CommandProcessor:
             if "dropped_article" in messages and item_id_final:
                 item_obj = self.world.items.get(item_id_final)
                 names = self.world.item_names(item_id_final)
-                name_acc = (getattr(item_obj, "forms", {}) or {}).get("acc") if item_obj else None
+                name_acc = (item_obj.forms or {}).get("acc") if item_obj else None
                 name_to_use = name_acc or (names[0] if names else item)
-                article = (getattr(item_obj, "articles", {}) or {}).get("acc") if item_obj else None
+                article = (item_obj.articles or {}).get("acc") if item_obj else None
                 if article:
                     self.io.output(messages["dropped_article"].format(article=article, name=name_to_use))
                 else:
@@ -506,16 +519,11 @@ class CommandProcessor:
             return False
         # Determine a friendly display name for the destination (first exit name)
         dest_display = direction
-        target_room_id = None
-        room = self.world.rooms[self.world.current]
-        dir_cf = direction.casefold()
-        for _target, cfg in room.exits.items():
-            names = cfg.get("names", [])
-            if any(n.casefold() == dir_cf for n in names):
-                if names:
-                    dest_display = names[0]
-                target_room_id = _target
-                break
+        target_room_id = self.world.find_exit(direction)
+        if target_room_id is not None:
+            names = self.world.rooms[self.world.current].exits[target_room_id]["names"]
+            if names:
+                dest_display = names[0]
 
         move_duration = self.world.get_exit_duration(direction)
         if self.world.can_move(direction) and self.world.move(direction):
@@ -527,13 +535,13 @@ class CommandProcessor:
                 if room_obj:
                     # Generic template with marker position support
                     gen_tpl = msgs.get("going_to_template")
-                    move_marker = room_obj.get("move_marker") if hasattr(room_obj, "get") else None
+                    move_marker = room_obj.move_marker
                     if gen_tpl and isinstance(move_marker, dict):
                         marker = str(move_marker.get("value", ""))
                         position = str(move_marker.get("position", "before"))
                         use_form = move_marker.get("use_form")
                         place_name = dest_display
-                        forms = room_obj.get("forms") if hasattr(room_obj, "get") else None
+                        forms = room_obj.forms
                         if isinstance(forms, dict) and isinstance(use_form, str):
                             place_name = forms.get(use_form, place_name)
                         pre = ""
@@ -551,7 +559,7 @@ class CommandProcessor:
                         # Backward-compatible article template
                         art_tpl = msgs.get("going_to_article")
                         if art_tpl:
-                            art = room_obj.get("to_article") if hasattr(room_obj, "get") else None
+                            art = room_obj.to_article
                             if art:
                                 self.io.output(art_tpl.format(article=art, place=dest_display))
             header = self.world.describe_room_header(self.language_manager.messages)
@@ -722,14 +730,15 @@ class CommandProcessor:
             self._dialog_npc = None
             self._dialog_node = None
             return False
-        dialog = getattr(npc, "dialog", {})
+        dialog = npc.dialog
         node = dialog.get(node_id)
         if not node:
             self._dialog_npc = None
             self._dialog_node = None
             return False
         if option_id is not None:
-            opt = next((o for o in node.options if o.id.casefold() == option_id.casefold()), None)
+            option_cf = option_id.casefold()
+            opt = next((o for o in node.options if o.id.casefold() == option_cf), None)
             if not opt:
                 return False
             eff = opt.effect or {}
@@ -776,7 +785,7 @@ class CommandProcessor:
             self.io.output(self.language_manager.messages["no_npc"])
             return True
         npc = self.world.npcs[npc_id]
-        dialog = getattr(npc, "dialog", {})
+        dialog = npc.dialog
         if dialog:
             self._dialog_npc = npc_id
             self._dialog_node = "start"
@@ -785,8 +794,7 @@ class CommandProcessor:
         self._dialog_npc = None
         self._dialog_node = None
         state = self.world.npc_state(npc_id)
-        state_key = state.value if isinstance(state, StateTag) else state
-        talk_cfg = npc.get("states", {}).get(state_key, {})
+        talk_cfg = npc.states.get(state or "", {})
         text = talk_cfg.get("talk")
         if text:
             self.io.output(text)
@@ -823,32 +831,21 @@ class CommandProcessor:
     def _match_any_item_id(self, name: str) -> str | None:
         if not name:
             return None
-        name = self._strip_leading_tokens(name)
-        name_cf = name.casefold()
-        for item_id in self.world.items:
-            names = self.world.item_names(item_id)
-            if any(n.casefold() == name_cf for n in names):
-                return item_id
-        return None
+        return self.world.find_item(self._strip_leading_tokens(name))
 
     def _match_any_npc_id(self, name: str) -> str | None:
         if not name:
             return None
-        name = self._strip_leading_tokens(name)
-        name_cf = name.casefold()
-        for npc_id, npc in self.world.npcs.items():
-            names = getattr(npc, "names", [])
-            if any(n.casefold() == name_cf for n in names):
-                return npc_id
-        return None
+        return self.world.find_npc(self._strip_leading_tokens(name))
 
     def _build_npc_prefixes(self) -> dict[str, str]:
         prefixes: dict[str, str] = {}
         names = {nid: npc.names[0] for nid, npc in self.world.npcs.items() if npc.names}
+        lowered_names = {nid: self.world.npcs[nid].names_cf[0] for nid in names}
         for nid, name in names.items():
             prefix_len = 1
-            lowered = name.casefold()
-            while any(other_id != nid and other_name.casefold().startswith(lowered[:prefix_len]) for other_id, other_name in names.items()):
+            lowered = lowered_names[nid]
+            while any(other_id != nid and other_cf.startswith(lowered[:prefix_len]) for other_id, other_cf in lowered_names.items()):
                 prefix_len += 1
             prefixes[nid] = name[:prefix_len]
         return prefixes
@@ -861,10 +858,10 @@ class CommandProcessor:
         npc = self.world.npcs.get(npc_id)
         if not npc:
             return
-        node = getattr(npc, "dialog", {}).get(node_id)
+        node = npc.dialog.get(node_id)
         if not node:
             return
-        options = list(getattr(node, "options", []))
+        options = list(node.options)
         if not options:
             return
         prefix = self._npc_prefixes.get(npc_id, "")
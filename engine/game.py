@@ -14,7 +14,6 @@ from .io import ConsoleIO
 from .language import LanguageManager
 from .llm import SUGGEST_PREFIX, UNKNOWN_TOKEN, NoOpLLM
 from .persistence import SaveManager
-from .world_model import StateTag
 
 
 class Game:
@@ -54,7 +53,7 @@ class Game:
         except FileNotFoundError as exc:
             self.io.output(f"ERROR: Missing world file: {exc}")
             raise SystemExit from exc
-        except yaml.YAMLError as exc:
+        except (yaml.YAMLError, world.WorldDataError) as exc:
             self.io.output(f"ERROR: Invalid world file: {exc}")
             raise SystemExit from exc
 
@@ -94,8 +93,9 @@ class Game:
         )
         self.llm.set_context(self.world, self.language_manager, self.command_processor.log)
         self.running = True
-        inv = list(self.world.inventory)
-        self.world.debug(f"game_init language {self._language} current {self.world.current} inventory {inv}")
+        if self.world.debug_enabled:
+            inv = list(self.world.inventory)
+            self.world.debug(f"game_init language {self._language} current {self.world.current} inventory {inv}")
 
     @property
     def language(self) -> str:
@@ -121,7 +121,7 @@ class Game:
             npc = self.world.npcs.get(npc_id)
             if not npc:
                 continue
-            meet = npc.get("meet", {})
+            meet = npc.meet
             pre = meet.get("preconditions")
             state = self.world.npc_state(npc_id)
             if pre and not self.world.check_preconditions(pre):
@@ -132,8 +132,7 @@ class Game:
                     self.io.output(text)
                 self.world.meet_npc(npc_id)
             else:
-                state_key = state.value if isinstance(state, StateTag) else state
-                text = npc.get("states", {}).get(state_key, {}).get("text")
+                text = npc.states.get(state or "", {}).get("text")
                 if text:
                     self.io.output(text)
 
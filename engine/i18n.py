@@ -4,13 +4,13 @@ from pathlib import Path
 
 import yaml
 
+from . import yaml_io
 from .interfaces import IOBackend
 
 
 def _load_yaml(path: Path, io: IOBackend) -> dict:
     try:
-        with open(path, encoding="utf-8") as fh:
-            return yaml.safe_load(fh)
+        return yaml_io.load_path(path)
     except FileNotFoundError as exc:
         io.output(f"ERROR: Missing file '{path.name}'")
         raise SystemExit from exc
@@ -5,10 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
-
-from . import world
-from .world_model import CommandCategory, LocationTag, StateTag
+from . import world, yaml_io
+from .world_model import CommandCategory, LocationTag
 
 
 def check_translations(language: str, data_dir: Path) -> list[str]:
@@ -21,10 +19,8 @@ def check_translations(language: str, data_dir: Path) -> list[str]:
     base_messages_path = data_dir / "en" / "messages.en.yaml"
     lang_messages_path = data_dir / language / f"messages.{language}.yaml"
     if base_messages_path.exists() and lang_messages_path.exists():
-        with open(base_messages_path, encoding="utf-8") as fh:
-            base_msgs = yaml.safe_load(fh) or {}
-        with open(lang_messages_path, encoding="utf-8") as fh:
-            lang_msgs = yaml.safe_load(fh) or {}
+        base_msgs = yaml_io.load_path(base_messages_path) or {}
+        lang_msgs = yaml_io.load_path(lang_messages_path) or {}
         for key in base_msgs:
             if key not in lang_msgs:
                 warnings.append(f"Missing translation for message '{key}'")
@@ -35,10 +31,8 @@ def check_translations(language: str, data_dir: Path) -> list[str]:
     base_cmds_path = data_dir / "generic" / "commands.yaml"
     lang_cmds_path = data_dir / language / f"commands.{language}.yaml"
     if base_cmds_path.exists() and lang_cmds_path.exists():
-        with open(base_cmds_path, encoding="utf-8") as fh:
-            base_cmd_keys = yaml.safe_load(fh) or []
-        with open(lang_cmds_path, encoding="utf-8") as fh:
-            lang_cmds = yaml.safe_load(fh) or {}
+        base_cmd_keys = yaml_io.load_path(base_cmds_path) or []
+        lang_cmds = yaml_io.load_path(lang_cmds_path) or {}
         for key in base_cmd_keys:
             if key not in lang_cmds:
                 warnings.append(f"Missing translation for command '{key}'")
@@ -66,10 +60,8 @@ def check_translations(language: str, data_dir: Path) -> list[str]:
     base_world_path = data_dir / "generic" / "world.yaml"
     lang_world_path = data_dir / language / f"world.{language}.yaml"
     if base_world_path.exists() and lang_world_path.exists():
-        with open(base_world_path, encoding="utf-8") as fh:
-            base_world = yaml.safe_load(fh) or {}
-        with open(lang_world_path, encoding="utf-8") as fh:
-            lang_world = yaml.safe_load(fh) or {}
+        base_world = yaml_io.load_path(base_world_path) or {}
+        lang_world = yaml_io.load_path(lang_world_path) or {}
         base_items = base_world.get("items", {})
         lang_items = lang_world.get("items", {})
         for item_id in base_items:
@@ -156,10 +148,8 @@ def validate_world_structure(w: world.World) -> list[str]:
             if cond_npc and cond_npc not in w.npcs:
                 errors.append(f"Action '{action}' precondition references missing NPC '{cond_npc}'")
             cond_state = cond.get("state")
-            if cond_npc and cond_state:
-                state_key = cond_state.value if isinstance(cond_state, StateTag) else cond_state
-                if state_key not in w.npcs.get(cond_npc, {}).get("states", {}):
-                    errors.append(f"Action '{action}' precondition references missing state '{state_key}' for NPC '{cond_npc}'")
+            if cond_npc and cond_state and cond_state not in w.npcs.get(cond_npc, {}).get("states", {}):
+                errors.append(f"Action '{action}' precondition references missing state '{cond_state}' for NPC '{cond_npc}'")
         eff = action.get("effect") or {}
         conds = eff.get("item_conditions") or []
         for cond in conds:
@@ -182,10 +172,8 @@ def validate_world_structure(w: world.World) -> list[str]:
             if cond_npc and cond_npc not in w.npcs:
                 errors.append(f"Action '{action}' effect references missing NPC '{cond_npc}'")
             cond_state = cond.get("state")
-            if cond_npc and cond_state:
-                state_key = cond_state.value if isinstance(cond_state, StateTag) else cond_state
-                if state_key not in w.npcs.get(cond_npc, {}).get("states", {}):
-                    errors.append(f"Action '{action}' effect references missing state '{state_key}' for NPC '{cond_npc}'")
+            if cond_npc and cond_state and cond_state not in w.npcs.get(cond_npc, {}).get("states", {}):
+                errors.append(f"Action '{action}' effect references missing state '{cond_state}' for NPC '{cond_npc}'")
             cond_loc = cond.get("location")
             if cond_loc:
                 if isinstance(cond_loc, LocationTag):
@@ -227,9 +215,8 @@ def validate_world_structure(w: world.World) -> list[str]:
         if loc and loc not in w.rooms:
             errors.append(f"NPC '{npc_id}' references missing room '{loc}'")
         state = npc.get("state")
-        state_key = state.value if isinstance(state, StateTag) else state
-        if state_key and state_key not in npc.get("states", {}):
-            errors.append(f"NPC '{npc_id}' has undefined state '{state_key}'")
+        if state and state not in npc.get("states", {}):
+            errors.append(f"NPC '{npc_id}' has undefined state '{state}'")
 
     for end_id, ending in w.endings.items():
         pre = ending.get("preconditions") or {}
@@ -260,10 +247,8 @@ def validate_world_structure(w: world.World) -> list[str]:
             if cond_npc and cond_npc not in w.npcs:
                 errors.append(f"Ending '{end_id}' references missing NPC '{cond_npc}'")
             cond_state = cond.get("state")
-            if cond_npc and cond_state:
-                state_key = cond_state.value if isinstance(cond_state, StateTag) else cond_state
-                if state_key not in w.npcs.get(cond_npc, {}).get("states", {}):
-                    errors.append(f"Ending '{end_id}' references missing state '{state_key}' for NPC '{cond_npc}'")
+            if cond_npc and cond_state and cond_state not in w.npcs.get(cond_npc, {}).get("states", {}):
+                errors.append(f"Ending '{end_id}' references missing state '{cond_state}' for NPC '{cond_npc}'")
 
     return errors
 
@@ -8,8 +8,6 @@ from contextlib import suppress
 from enum import IntEnum
 from typing import TYPE_CHECKING
 
-import requests
-
 from .interfaces import LLMBackend
 from .persistence import LogEntry
 
@@ -53,6 +51,9 @@ class OllamaLLM(LLMBackend):
         check_model: bool = False,
         min_confidence: float | None = None,
     ) -> None:
+        import requests  # deferred: only LLM sessions pay for importing requests
+
+        self._requests = requests
         self.model = model or os.getenv("OLLAMA_MODEL", "mistral")
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.timeout = timeout
@@ -98,7 +99,7 @@ class OllamaLLM(LLMBackend):
             with suppress(Exception):  # pragma: no cover - best-effort
                 system_preview = messages[0]["content"][:160].replace("\n", " ")
                 self.world.debug(f"request system='{system_preview}…'")
-            post = requests.post
+            post = self._requests.post
             try:
                 import inspect
 
@@ -353,7 +354,7 @@ class OllamaLLM(LLMBackend):
         On failure, exit the program with a helpful message.
         """
         try:
-            resp = requests.get(  # noqa: S113 - explicit timeout provided
+            resp = self._requests.get(  # noqa: S113 - explicit timeout provided
                 f"{self.base_url}/api/tags",
                 timeout=self.timeout,
             )
@@ -7,7 +7,7 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import yaml
+from . import yaml_io
 
 if TYPE_CHECKING:  # pragma: no cover - used for type checking only
     from .world import World
@@ -37,8 +37,7 @@ class SaveManager:
 
         if not self.save_path.exists():
             return {}
-        with open(self.save_path, encoding="utf-8") as fh:
-            data = yaml.safe_load(fh) or {}
+        data = yaml_io.load_save(self.save_path) or {}
         log_data = data.get("log", [])
         data["log"] = [LogEntry(**entry) for entry in log_data]
         return data
@@ -50,8 +49,7 @@ class SaveManager:
         data["language"] = language
         if log:
             data["log"] = [asdict(entry) for entry in log]
-        with open(self.save_path, "w", encoding="utf-8") as fh:
-            yaml.safe_dump(data, fh)
+        yaml_io.dump_save(data, self.save_path)
 
     def cleanup(self) -> None:
         """Remove the save file if it exists."""
@@ -1,46 +1,85 @@
 """World representation loaded from data files."""
 
-import inspect
+import hashlib
 import os
 import sys
+from collections.abc import Callable, Iterable
 from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import pydantic
 import yaml
 
-from .world_model import Action, Item, LocationTag, Npc, Room, StateTag
+from . import world_model, yaml_io
+from .world_model import Action, Item, LocationTag, Npc, Room, StateTag, casefold_names
+
+_PROBE_MAX_LINES = 20
+
+# Modules whose code shapes the cached merged world data; editing them invalidates the cache
+_MERGE_CODE: tuple[str, ...] = (__file__, world_model.__file__, yaml_io.__file__)
+
+# Shared read-only default for lookups that may miss; never mutate it
+_EMPTY: dict[str, Any] = {}
+
+
+@lru_cache(maxsize=64)
+def _basename(path: str) -> str:
+    return os.path.basename(path)
+
+
+class WorldDataError(ValueError):
+    """Raised when world data is well-formed YAML but not a valid world."""
+
+
+_TAG_LOOKUP: dict[str, LocationTag] = {m.value: m for m in LocationTag}
 
 
 def _convert_tags(obj: Any) -> Any:
-    if isinstance(obj, dict):
-        return {k: _convert_tags(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_convert_tags(v) for v in obj]
+    """Replace tag strings with their enum members, in place; callers must own ``obj``."""
     if isinstance(obj, str):
-        if obj in LocationTag._value2member_map_:
-            return LocationTag(obj)
-        if obj in StateTag._value2member_map_:
-            return StateTag(obj)
+        return _TAG_LOOKUP.get(obj, obj)
+    lookup = _TAG_LOOKUP
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            entries = node.items()
+        elif isinstance(node, list):
+            entries = enumerate(node)
+        else:
+            continue
+        for key, value in entries:
+            if isinstance(value, str):
+                tag = lookup.get(value)
+                if tag is not None:
+                    node[key] = tag
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
     return obj
 
 
+def _exit_entry(names: list[str]) -> dict[str, Any]:
+    return {"names": names, "names_cf": casefold_names(names)}
+
+
 def _normalize_room_config(room: dict[str, Any]) -> dict[str, Any]:
     """Normalize room configuration for pydantic validation."""
     exits = room.get("exits")
     if not exits:
         return room
     if isinstance(exits, list):
-        room["exits"] = {e: {"names": [e]} for e in exits}
+        room["exits"] = {e: _exit_entry([e]) for e in exits}
         return room
     new_exits: dict[str, dict[str, Any]] = {}
     for target, cfg in exits.items():
         if isinstance(cfg, list):
-            new_exits[target] = {"names": list(cfg)}
+            new_exits[target] = _exit_entry(list(cfg))
         elif isinstance(cfg, dict):
             names = cfg.get("names", [])
             pre = cfg.get("preconditions")
-            entry = {"names": list(names)}
+            entry = _exit_entry(list(names))
             if pre:
                 entry["preconditions"] = pre
             raw_dur = cfg.get("duration")
@@ -49,31 +88,172 @@ def _normalize_room_config(room: dict[str, Any]) -> dict[str, Any]:
                     entry["duration"] = int(raw_dur)  # type: ignore[arg-type]
             new_exits[target] = entry
         else:  # pragma: no cover - legacy single-string syntax
-            new_exits[target] = {"names": [cfg]}
+            new_exits[target] = _exit_entry([cfg])
     room["exits"] = new_exits
     return room
 
 
+_PreCheck = Callable[["World"], bool]
+
+
+def _never(_w: "World") -> bool:
+    return False
+
+
+def _compile_item_condition(cond: dict[str, Any]) -> _PreCheck:
+    item_id = cond.get("item")
+    if not item_id:
+        return _never
+    state = cond.get("state")
+    location = cond.get("location")
+    checks: list[_PreCheck] = []
+    if state is not None:
+
+        def in_state(w: "World") -> bool:
+            item = w.items.get(item_id)
+            return item is not None and item.state == state
+
+        checks.append(in_state)
+    if location is LocationTag.INVENTORY:
+
+        def carried(w: "World") -> bool:
+            return item_id in w.inventory
+
+        checks.append(carried)
+    elif location:
+        room_id = None if location is LocationTag.CURRENT_ROOM else location
+
+        def in_room(w: "World") -> bool:
+            room = w.rooms.get(room_id or w.current)
+            return room is not None and item_id in room.items
+
+        checks.append(in_room)
+    return _fuse_checks(tuple(checks))
+
+
+def _compile_npc_condition(npc_id: str | None, state: Any) -> _PreCheck:
+    if not npc_id or state is None:
+        return _never
+    return lambda w: w.npc_state(npc_id) == state
+
+
+def _always(_w: "World") -> bool:
+    return True
+
+
+def _fuse_checks(checks: tuple[_PreCheck, ...]) -> _PreCheck:
+    """Combine ``checks`` into one short-circuiting callable without a per-call generator."""
+    if not checks:
+        return _always
+    first = checks[0]
+    if len(checks) == 1:
+        return first
+    rest = _fuse_checks(checks[1:])
+    return lambda w: first(w) and rest(w)
+
+
+def _compile_preconditions(pre: dict[str, Any]) -> tuple[_PreCheck, ...]:
+    """Turn a precondition mapping into checks specialized on its contents.
+
+    Checks that can never pass come first, then the rest by static cost (string compare,
+    dict lookups, list scans) so cheap ones short-circuit; ties keep their order.
+    """
+    checks: list[tuple[int, _PreCheck]] = []
+    loc = pre.get("is_location")
+    if loc:
+        loc_id = loc.value if isinstance(loc, LocationTag) else loc
+        checks.append((0, lambda w: w.current == loc_id))
+    for ic in pre.get("item_conditions") or ():
+        checks.append((2 if ic.get("location") else 1, _compile_item_condition(ic)))
+    npc_met = pre.get("npc_met")
+    if npc_met:
+        checks.append((1, _compile_npc_condition(npc_met, StateTag.MET)))
+    npc_help = pre.get("npc_help")
+    if npc_help:
+        checks.append((1, _compile_npc_condition(npc_help, StateTag.HELPED)))
+    npc_state = pre.get("npc_state")
+    if npc_state:
+        checks.append((1, _compile_npc_condition(npc_state.get("npc"), npc_state.get("state"))))
+    checks.extend((1, _compile_npc_condition(nc.get("npc"), nc.get("state"))) for nc in pre.get("npc_conditions") or ())
+    return tuple(check for _cost, check in sorted(checks, key=lambda c: -1 if c[1] is _never else c[0]))
+
+
 class World:
-    def __init__(self, data: dict[str, Any], debug: bool = False):
+    __slots__ = (
+        "_base_exits",
+        "_base_inventory",
+        "_base_item_states",
+        "_base_npc_states",
+        "_base_rooms",
+        "_debug_enabled",
+        "_dirty",
+        "_endings_by_loc",
+        "_endings_cache",
+        "_header_cache",
+        "_inventory_index",
+        "_item_index",
+        "_item_location",
+        "_item_names",
+        "_npc_index",
+        "_npc_location",
+        "_pre_checks",
+        "_room_index",
+        "_state_diff",
+        "_state_names_cf",
+        "_version",
+        "_visibility_cache",
+        "actions",
+        "current",
+        "endings",
+        "intro",
+        "inventory",
+        "items",
+        "npcs",
+        "rooms",
+        "time",
+    )
+
+    def __init__(self, data: dict[str, Any], debug: bool = False, *, exits_normalized: bool = False):
+        """Build a world from constructor data, as produced by :meth:`from_files`.
+
+        The world takes ownership of ``data``: tag strings in it are replaced by
+        their enum members in place and its lists become the world's state, so
+        callers must not reuse it.
+
+        ``exits_normalized`` says the exits of ``Room`` instances already carry
+        ``names_cf``, so they are only re-interned rather than casefolded again.
+        """
         data = _convert_tags(data)
         self._debug_enabled = debug
         raw_rooms = data.get("rooms", {})
         raw_items = data.get("items", {})
         raw_npcs = data.get("npcs", {})
+        intern = sys.intern
         processed_rooms: dict[str, Room] = {}
         for room_id, room in raw_rooms.items():
             if isinstance(room, Room):
+                for cfg in room.exits.values():
+                    if exits_normalized:
+                        # Unpickling does not intern strings
+                        cfg["names_cf"] = tuple(map(intern, cfg["names_cf"]))
+                    else:
+                        cfg["names_cf"] = casefold_names(cfg.get("names", []))
                 processed_rooms[room_id] = room
             else:
                 cfg = _normalize_room_config(dict(room))
-                processed_rooms[room_id] = Room(**cfg)
-        self.rooms = processed_rooms
-        self.items = {item_id: item if isinstance(item, Item) else Item(**item) for item_id, item in raw_items.items()}
-        self.npcs = {npc_id: npc if isinstance(npc, Npc) else Npc(**npc) for npc_id, npc in raw_npcs.items()}
-        self.current = data["start"]
+                processed_rooms[room_id] = Room.model_validate(cfg)
+        for room in processed_rooms.values():
+            room.items[:] = map(intern, room.items)
+            room.occupants[:] = map(intern, room.occupants)
+            room.exits = {intern(target): cfg for target, cfg in room.exits.items()}
+        self.rooms = {intern(room_id): room for room_id, room in processed_rooms.items()}
+        self.items = {intern(item_id): item if isinstance(item, Item) else Item.model_validate(item) for item_id, item in raw_items.items()}
+        self.npcs = {intern(npc_id): npc if isinstance(npc, Npc) else Npc.model_validate(npc) for npc_id, npc in raw_npcs.items()}
+        self.current = intern(data["start"])
         self.inventory: list[str] = data.get("inventory", [])
+        self.inventory[:] = map(intern, self.inventory)
         self.endings = data.get("endings", {})
+        self._endings_by_loc = self._bucket_endings(self.endings)
         self.intro = data.get("intro", "")
         actions = data.get("actions", [])
         if isinstance(actions, dict):
@@ -85,60 +265,248 @@ class World:
                 if "precondition" in action and "preconditions" not in action:
                     action["preconditions"] = action.pop("precondition")
             normalized.append(action)
-        self.actions = [act if isinstance(act, Action) else Action(**act) for act in normalized]
+        self.actions = [act if isinstance(act, Action) else Action.model_validate(act) for act in normalized]
+        self._validate_effects()
         # Time management: TU (time units); default start at 0
         self.time: int = int(data.get("time", 0) or 0)
-        self.item_states: dict[str, str | StateTag] = {
-            item_id: item_data.state for item_id, item_data in self.items.items() if item_data.state is not None
-        }
-        self.npc_states: dict[str, str | StateTag] = {
-            npc_id: npc_data.state for npc_id, npc_data in self.npcs.items() if npc_data.state is not None
-        }
-        self._base_rooms: dict[str, list[str]] = {room_id: list(room.items) for room_id, room in self.rooms.items()}
-        self._base_exits: dict[str, set[str]] = {room_id: set(room.exits.keys()) for room_id, room in self.rooms.items()}
-        self._base_inventory: list[str] = list(self.inventory)
-        self._base_item_states: dict[str, str | StateTag] = dict(self.item_states)
-        self._base_npc_states: dict[str, str | StateTag] = dict(self.npc_states)
+        self._state_names_cf: dict[tuple[str, str], tuple[Item, tuple[str, ...]]] = {}
+        self._item_names: dict[tuple[str, str | None], tuple[Item, tuple[str, ...]]] = {}
+        # Bumped by every World mutator; keys the derived caches below
+        self._version = 0
+        self._header_cache: tuple[tuple[str, int], dict[str, str] | None, str] | None = None
+        self._visibility_cache: tuple[tuple[str, int], dict[str, str] | None, str | None] | None = None
+        self._endings_cache: tuple[tuple[str, int], str | None] | None = None
+        self._inventory_index: tuple[tuple[tuple[str, ...], int], dict[str, str]] | None = None
+        # World-wide casefolded name -> id lookups; rooms and NPCs keep their names, items follow state
+        self._item_index: tuple[tuple[int, int], dict[str, str]] | None = None
+        self._npc_index: tuple[int, dict[str, str]] | None = None
+        self._room_index: tuple[int, dict[str, str]] | None = None
+        self._base_rooms: dict[str, list[str]] = {}
+        self._base_exits: dict[str, set[str]] = {}
+        for room_id, room in self.rooms.items():
+            self._base_rooms[room_id] = room.items.copy()
+            self._base_exits[room_id] = set(room.exits)
+        self._base_inventory: list[str] = self.inventory.copy()
+        self._base_item_states: dict[str, str] = self.item_states
+        self._base_npc_states: dict[str, str] = self.npc_states
+        self._item_location: dict[str, str] = {}
+        self._index_item_locations()
+        # Keys touched since the last to_state(), and the per-category diffs it maintains
+        self._dirty: dict[str, set[str]] = {"rooms": set(), "exits": set(), "item_states": set(), "npc_states": set()}
+        self._state_diff: dict[str, dict[str, Any]] = {category: {} for category in self._dirty}
+        arrivals: dict[str, list[str]] = {}
         for npc_id, npc in self.npcs.items():
             loc = npc.meet.get("location")
             if loc and loc in self.rooms:
-                room = self.rooms[loc]
-                room.occupants.append(npc_id)
+                arrivals.setdefault(loc, []).append(npc_id)
+        for room_id, npc_ids in arrivals.items():
+            self.rooms[room_id].occupants.extend(npc_ids)
+        self._npc_location: dict[str, str] = {}
+        for room_id, room in self.rooms.items():
+            for npc_id in room.occupants:
+                self._npc_location.setdefault(npc_id, room_id)
+        self._pre_checks: dict[int, tuple[dict[str, Any], _PreCheck]] = {}
+        owners: list[Any] = [action.preconditions for action in self.actions]
+        owners.extend(ending.get("preconditions") for ending in self.endings.values() if isinstance(ending, dict))
+        owners.extend(cfg.get("preconditions") for room in self.rooms.values() for cfg in room.exits.values())
+        owners.extend(npc.meet.get("preconditions") for npc in self.npcs.values())
+        for pre in owners:
+            if isinstance(pre, dict):
+                self._compiled_preconditions(pre)
 
     # --- item naming helpers (state-aware) ---
-    def item_names(self, item_id: str) -> list[str]:
+    def item_names(self, item_id: str) -> tuple[str, ...]:
+        """Return the item's names for its current state, cached per item and state."""
         item = self.items.get(item_id)
         if not item:
-            return []
-        base = list(item.names or [])
+            return ()
+        key = (item_id, item.state)
+        cached = self._item_names.get(key)
+        if cached is not None and cached[0] is item:
+            return cached[1]
+        names = tuple(item.names or ())
         st = item.state
-        if isinstance(st, StateTag):
-            st = st.value
         if st:
             st_cfg = (item.states or {}).get(st, {})
             st_names = st_cfg.get("names") if isinstance(st_cfg, dict) else None
             if st_names:
-                try:
-                    return list(st_names)
-                except Exception:
-                    return base
-        return base
+                with suppress(TypeError):
+                    names = tuple(st_names)
+        self._item_names[key] = (item, names)
+        return names
+
+    def item_names_cf(self, item_id: str) -> tuple[str, ...]:
+        """Casefolded variant of :meth:`item_names`, cached per item state."""
+        item = self.items.get(item_id)
+        if not item:
+            return ()
+        st = item.state
+        if st:
+            st_cfg = (item.states or {}).get(st, {})
+            if isinstance(st_cfg, dict) and st_cfg.get("names"):
+                key = (item_id, st)
+                cached = self._state_names_cf.get(key)
+                if cached is not None and cached[0] is item:
+                    return cached[1]
+                names = casefold_names(self.item_names(item_id))
+                self._state_names_cf[key] = (item, names)
+                return names
+        return item.names_cf
+
+    def _build_name_index(self, item_ids: Iterable[str]) -> dict[str, str]:
+        index: dict[str, str] = {}
+        for item_id in item_ids:
+            for name_cf in self.item_names_cf(item_id):
+                index.setdefault(name_cf, item_id)
+        return index
+
+    def _room_name_index(self, room: Room) -> dict[str, str]:
+        key = (tuple(room.items), self._version)
+        cached = room._name_index
+        if cached is None or cached[0] != key:
+            cached = room._name_index = (key, self._build_name_index(room.items))
+        return cached[1]
+
+    def _inventory_name_index(self) -> dict[str, str]:
+        key = (tuple(self.inventory), self._version)
+        cached = self._inventory_index
+        if cached is None or cached[0] != key:
+            cached = self._inventory_index = (key, self._build_name_index(self.inventory))
+        return cached[1]
+
+    def find_room_item(self, item_name: str) -> str | None:
+        """Return the id of the item in the current room called ``item_name``."""
+        return self._room_name_index(self.rooms[self.current]).get(item_name.casefold())
+
+    def find_inventory_item(self, item_name: str) -> str | None:
+        """Return the id of the carried item called ``item_name``."""
+        return self._inventory_name_index().get(item_name.casefold())
+
+    def find_item(self, item_name: str) -> str | None:
+        """Return the id of any item called ``item_name``, wherever it is."""
+        key = (len(self.items), self._version)
+        cached = self._item_index
+        if cached is None or cached[0] != key:
+            cached = self._item_index = (key, self._build_name_index(self.items))
+        return cached[1].get(item_name.casefold())
+
+    def find_npc(self, npc_name: str) -> str | None:
+        """Return the id of any NPC called ``npc_name``, wherever it is."""
+        cached = self._npc_index
+        if cached is None or cached[0] != len(self.npcs):
+            index: dict[str, str] = {}
+            for npc_id, npc in self.npcs.items():
+                for name_cf in npc.names_cf:
+                    index.setdefault(name_cf, npc_id)
+            cached = self._npc_index = (len(self.npcs), index)
+        return cached[1].get(npc_name.casefold())
+
+    def find_room(self, room_name: str) -> str | None:
+        """Return the id of the room called ``room_name``."""
+        cached = self._room_index
+        if cached is None or cached[0] != len(self.rooms):
+            index: dict[str, str] = {}
+            for room_id, room in self.rooms.items():
+                for name_cf in room.names_cf:
+                    index.setdefault(name_cf, room_id)
+            cached = self._room_index = (len(self.rooms), index)
+        return cached[1].get(room_name.casefold())
+
+    def _room_exit_index(self, room: Room) -> dict[str, str]:
+        key = (tuple(room.exits), self._version)
+        cached = room._exit_index
+        if cached is None or cached[0] != key:
+            index: dict[str, str] = {}
+            for target, cfg in room.exits.items():
+                for name_cf in cfg["names_cf"]:
+                    index.setdefault(name_cf, target)
+            cached = room._exit_index = (key, index)
+        return cached[1]
+
+    def find_exit(self, exit_name: str) -> str | None:
+        """Return the target room id of the current room's exit called ``exit_name``."""
+        return self._room_exit_index(self.rooms[self.current]).get(exit_name.casefold())
+
+    def _validate_effects(self) -> None:
+        """Check the shape of every effect once so applying one needs no guards."""
+        effects = [action.effect for action in self.actions]
+        for npc in self.npcs.values():
+            for node in npc.dialog.values():
+                effects.append(node.effect)
+                effects.extend(opt.effect for opt in node.options)
+        for effect in effects:
+            for cfg in (effect or {}).get("add_exits") or ():
+                pre = cfg.get("preconditions")
+                if pre is not None and not isinstance(pre, dict):
+                    raise WorldDataError("preconditions must be a mapping")
+
+    def _ensure_room(self, room_id: str) -> Room:
+        """Return the room ``room_id``, creating an empty placeholder only if it is missing."""
+        room = self.rooms.get(room_id)
+        if room is None:
+            room = self.rooms[room_id] = Room(names=[], description="")
+        return room
+
+    def _index_item_locations(self) -> None:
+        """Rebuild the item -> room map; carried or unplaced items are absent."""
+        self._item_location = {item_id: room_id for room_id, room in self.rooms.items() for item_id in room.items}
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether :meth:`debug` prints; lets callers skip building costly messages."""
+        return self._debug_enabled
 
     def debug(self, message: str) -> None:
         if self._debug_enabled:
-            frame = inspect.stack()[1]
-            filename = os.path.basename(frame.filename)
-            lineno = frame.lineno
-            print(f"{filename}:{lineno} -- {message}", file=sys.stderr)
+            frame = sys._getframe(1)
+            filename = _basename(frame.f_code.co_filename)
+            print(f"{filename}:{frame.f_lineno} -- {message}", file=sys.stderr)
+
+    @classmethod
+    def probe(cls, path: str | Path) -> dict[str, Any] | None:
+        """Parse only the leading block of a world file.
+
+        Reads up to the first blank line (at most ``_PROBE_MAX_LINES`` lines) so callers
+        that only need header metadata can skip the full parse. Returns ``None`` if the
+        header is empty or not a mapping.
+        """
+        lines: list[str] = []
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if not line.strip() or len(lines) >= _PROBE_MAX_LINES:
+                    break
+                lines.append(line)
+        if not lines:
+            return None
+        try:
+            header = yaml_io.safe_load("".join(lines))
+        except yaml.YAMLError:
+            return None
+        return header if isinstance(header, dict) else None
 
     @classmethod
     def from_files(cls, config_path: str | Path, language_path: str | Path, debug: bool = False) -> "World":
-        with open(config_path, encoding="utf-8") as fh:
-            base = yaml.safe_load(fh)
-        with open(language_path, encoding="utf-8") as fh:
-            lang = yaml.safe_load(fh)
+        """Build a world from its generic config and a translation.
+
+        The merged, validated data is pickled in the per-user cache directory and
+        reused until either file, the merge code or the pydantic version changes.
+        """
+        language_path = Path(language_path)
+        key = f"{Path(config_path).resolve()}\0{language_path.resolve()}"
+        digest = hashlib.sha256(key.encode(errors="surrogateescape")).hexdigest()[:16]
+        cache_path = yaml_io.cache_dir() / f"{language_path.name}.{digest}.world.pkl"
+        sources = (config_path, language_path, *_MERGE_CODE)
+        data = yaml_io.cached(cache_path, sources, lambda: cls._merge_files(config_path, language_path), version=pydantic.VERSION)
+        return cls(data, debug=debug, exits_normalized=True)
+
+    @staticmethod
+    def _merge_files(config_path: str | Path, language_path: str | Path) -> dict[str, Any]:
+        """Merge the generic config with a translation into ``World`` constructor data."""
+        base = yaml_io.load_path(config_path)
+        lang = yaml_io.load_path(language_path)
         items: dict[str, Any] = base.get("items", {})
-        for item_id, item_data in lang.get("items", {}).items():
+        lang_items: dict[str, Any] = lang.get("items", _EMPTY)
+        for item_id, item_data in lang_items.items():
             item_cfg = items.setdefault(item_id, {})
             lang_states = item_data.get("states")
             if lang_states:
@@ -155,12 +523,12 @@ class World:
             if cfg_room.get("items"):
                 room["items"] = list(cfg_room["items"])
             exits: dict[str, Any] = {}
-            cfg_exits = cfg_room.get("exits", {})
+            cfg_exits = cfg_room.get("exits", _EMPTY)
             if isinstance(cfg_exits, list):
                 cfg_exits = {target: {} for target in cfg_exits}
             for target, exit_cfg in cfg_exits.items():
-                names = lang_rooms.get(target, {}).get("names", [target])
-                exit_entry: dict[str, Any] = {"names": names}
+                names = lang_rooms.get(target, _EMPTY).get("names", [target])
+                exit_entry = _exit_entry(names)
                 pre = exit_cfg.get("preconditions") if isinstance(exit_cfg, dict) else None
                 if pre:
                     exit_entry["preconditions"] = pre
@@ -172,7 +540,7 @@ class World:
                 exits[target] = exit_entry
             if exits:
                 room["exits"] = exits
-            lang_room = lang_rooms.get(room_id, {})
+            lang_room = lang_rooms.get(room_id, _EMPTY)
             names = lang_room.get("names")
             if names:
                 room["names"] = names
@@ -189,21 +557,21 @@ class World:
             if "description" not in item_cfg:
                 item_cfg["description"] = item_id
             # Optional language-specific forms and articles for items
-            lang_item = lang.get("items", {}).get(item_id, {})
+            lang_item = lang_items.get(item_id, _EMPTY)
             forms = lang_item.get("forms")
             if isinstance(forms, dict):
                 item_cfg["forms"] = dict(forms)
             articles = lang_item.get("articles")
             if isinstance(articles, dict):
                 item_cfg["articles"] = dict(articles)
-            states = item_cfg.get("states", {})
+            states = item_cfg.get("states", _EMPTY)
             for state_id, state_cfg in states.items():
                 state_cfg.setdefault("description", state_id)
         for room_id, room in rooms.items():
             room.setdefault("names", [room_id])
             room.setdefault("description", room_id)
             # Optional forms and move marker for rooms
-            lang_room = lang_rooms.get(room_id, {})
+            lang_room = lang_rooms.get(room_id, _EMPTY)
             forms = lang_room.get("forms")
             if isinstance(forms, dict):
                 room["forms"] = dict(forms)
@@ -214,19 +582,18 @@ class World:
         base_endings = base.get("endings", {})
         lang_endings = lang.get("endings", {})
         for end_id, cfg_end in base_endings.items():
-            ending = dict(cfg_end)
             lang_cfg = lang_endings.get(end_id)
             if isinstance(lang_cfg, dict):
-                ending.update(lang_cfg)
+                endings[end_id] = cfg_end | lang_cfg
             elif lang_cfg is not None:
-                ending["description"] = lang_cfg
-            endings[end_id] = ending
+                endings[end_id] = cfg_end | {"description": lang_cfg}
+            else:
+                endings[end_id] = dict(cfg_end)
         actions: list[dict[str, Any]] = []
         base_actions = base.get("actions", {})
         lang_actions = lang.get("actions", {})
         for action_id, cfg_action in base_actions.items():
-            action = dict(cfg_action)
-            action.update(lang_actions.get(action_id, {}))
+            action = cfg_action | lang_actions.get(action_id, _EMPTY)
             precond = action.pop("precondition", None)
             if precond is not None and "preconditions" not in action:
                 action["preconditions"] = precond
@@ -263,7 +630,7 @@ class World:
                                     base_opts.append({"id": opt_id, "prompt": prompt})
                     continue
                 if isinstance(value, dict):
-                    npc_cfg.setdefault(key, {}).update(value)
+                    npc_cfg[key] = npc_cfg.get(key, _EMPTY) | value
                 else:
                     npc_cfg[key] = value
         items = _convert_tags(items)
@@ -285,36 +652,54 @@ class World:
                 start_time_minutes = None
 
         data = {
-            "items": {item_id: Item(**cfg) for item_id, cfg in items.items()},
-            "rooms": {room_id: Room(**cfg) for room_id, cfg in rooms.items()},
+            "items": {item_id: Item.model_validate(cfg) for item_id, cfg in items.items()},
+            "rooms": {room_id: Room.model_validate(cfg) for room_id, cfg in rooms.items()},
             "start": base["start"],
             "endings": endings,
-            "actions": [Action(**a) for a in actions],
-            "npcs": {npc_id: Npc(**cfg) for npc_id, cfg in npcs.items()},
+            "actions": [Action.model_validate(a) for a in actions],
+            "npcs": {npc_id: Npc.model_validate(cfg) for npc_id, cfg in npcs.items()},
             "intro": lang.get("intro", ""),
         }
         if start_time_minutes is not None:
             data["time"] = start_time_minutes
-        return cls(data, debug=debug)
+        return data
 
-    def to_state(self) -> dict[str, Any]:
-        """Return the minimal state describing differences from the base world."""
-        state: dict[str, Any] = {"current": self.current}
-        if self.inventory != self._base_inventory:
-            state["inventory"] = self.inventory
-        rooms_diff: dict[str, list[str]] = {}
-        for room_id, room in self.rooms.items():
-            items = list(room.items)
-            base_items = self._base_rooms.get(room_id, [])
-            if items != base_items:
-                rooms_diff[room_id] = items
-        if rooms_diff:
-            state["rooms"] = rooms_diff
-        exits_added: dict[str, dict[str, Any]] = {}
-        for room_id, room in self.rooms.items():
+    @staticmethod
+    def _bucket_endings(endings: dict[str, Any]) -> dict[str | None, list[dict[str, Any]]]:
+        """Group endings by the room they require, keeping their original order.
+
+        Each room bucket also holds the location-independent endings; the ``None``
+        bucket holds only those.
+        """
+        keyed: list[tuple[str | None, dict[str, Any]]] = []
+        for ending in endings.values():
+            pre = ending.get("preconditions")
+            loc = pre.get("is_location") if isinstance(pre, dict) else None
+            keyed.append((loc.value if isinstance(loc, LocationTag) else loc or None, ending))
+        buckets: dict[str | None, list[dict[str, Any]]] = {None: [e for loc, e in keyed if loc is None]}
+        for room_id in {loc for loc, _ in keyed if loc is not None}:
+            buckets[room_id] = [e for loc, e in keyed if loc in (room_id, None)]
+        return buckets
+
+    def _mark_dirty(self, category: str, key: str | None) -> None:
+        if key is not None:
+            self._dirty[category].add(key)
+
+    def _refresh_state_diff(self) -> None:
+        """Recompute the state diff entries touched since the last call."""
+        dirty = self._dirty
+        diff = self._state_diff
+        for room_id in dirty["rooms"]:
+            room = self.rooms.get(room_id)
+            if room is not None and room.items != self._base_rooms.get(room_id, []):
+                diff["rooms"][room_id] = list(room.items)
+            else:
+                diff["rooms"].pop(room_id, None)
+        for room_id in dirty["exits"]:
+            room = self.rooms.get(room_id)
             base_exits = self._base_exits.get(room_id, set())
             added: dict[str, Any] = {}
-            for target, cfg in room.exits.items():
+            for target, cfg in room.exits.items() if room is not None else ():
                 if target not in base_exits:
                     pre = cfg.get("preconditions")
                     dur = cfg.get("duration")
@@ -325,46 +710,52 @@ class World:
                         entry["duration"] = int(dur)
                     added[target] = entry
             if added:
-                exits_added[room_id] = added
-        if exits_added:
-            state["exits"] = exits_added
-        states_diff: dict[str, str] = {}
-        for item_id, cur_state in self.item_states.items():
-            if self._base_item_states.get(item_id) != cur_state:
-                val = cur_state.value if isinstance(cur_state, StateTag) else cur_state
-                states_diff[item_id] = val
-        if states_diff:
-            state["item_states"] = states_diff
-        npc_states_diff: dict[str, str] = {}
-        for npc_id, cur_state in self.npc_states.items():
-            if self._base_npc_states.get(npc_id) != cur_state:
-                val = cur_state.value if isinstance(cur_state, StateTag) else cur_state
-                npc_states_diff[npc_id] = val
-        if npc_states_diff:
-            state["npc_states"] = npc_states_diff
+                diff["exits"][room_id] = added
+            else:
+                diff["exits"].pop(room_id, None)
+        for category, models, base in (
+            ("item_states", self.items, self._base_item_states),
+            ("npc_states", self.npcs, self._base_npc_states),
+        ):
+            for key in dirty[category]:
+                model = models.get(key)
+                cur_state = model.state if model is not None else None
+                if cur_state is not None and base.get(key) != cur_state:
+                    diff[category][key] = str(cur_state)
+                else:
+                    diff[category].pop(key, None)
+        for keys in dirty.values():
+            keys.clear()
+
+    def to_state(self) -> dict[str, Any]:
+        """Return the minimal state describing differences from the base world."""
+        state: dict[str, Any] = {"current": self.current}
+        if self.inventory != self._base_inventory:
+            state["inventory"] = self.inventory
+        self._refresh_state_diff()
+        for category in ("rooms", "exits", "item_states", "npc_states"):
+            if self._state_diff[category]:
+                state[category] = dict(self._state_diff[category])
         # Persist time only if progressed
         if self.time:
             state["time"] = int(self.time)
         return state
 
     def save(self, path: str | Path) -> None:
-        with open(path, "w", encoding="utf-8") as fh:
-            yaml.safe_dump(self.to_state(), fh)
+        yaml_io.dump_save(self.to_state(), path)
 
     def load_state(self, path: str | Path) -> None:
-        with open(path, encoding="utf-8") as fh:
-            data = yaml.safe_load(fh) or {}
-        self.current = data.get("current", self.current)
-        self.inventory = data.get("inventory", self.inventory)
+        data = yaml_io.load_save(path) or {}
+        intern = sys.intern
+        self.current = intern(data.get("current", self.current))
+        self.inventory = [intern(item_id) for item_id in data.get("inventory", self.inventory)]
         room_items = data.get("rooms", {})
         for room_id, room in self.rooms.items():
             items = room_items.get(room_id)
             if items is None:
                 continue
-            if items:
-                room.items = items
-            else:
-                room.items = []
+            room.items = [intern(item_id) for item_id in items]
+        self._index_item_locations()
         exits_added = data.get("exits", {})
         for room_id, mapping in exits_added.items():
             for target, cfg in (mapping or {}).items():
@@ -373,82 +764,33 @@ class World:
                 self.add_exit(room_id, target, pre, int(dur) if dur is not None else None)
         item_states = data.get("item_states", {})
         for item_id, state in item_states.items():
-            if item_id in self.item_states:
-                val = StateTag(state) if isinstance(state, str) and state in StateTag._value2member_map_ else state
-                self.item_states[item_id] = val
-                self.items[item_id].state = val
+            item = self.items.get(item_id)
+            if item is not None and item.state is not None:
+                item.state = intern(state)
         npc_states = data.get("npc_states", {})
         for npc_id, state in npc_states.items():
-            if npc_id in self.npc_states:
-                val = StateTag(state) if isinstance(state, str) and state in StateTag._value2member_map_ else state
-                self.npc_states[npc_id] = val
-                self.npcs[npc_id].state = val
+            npc = self.npcs.get(npc_id)
+            if npc is not None and npc.state is not None:
+                npc.state = intern(state)
         # time restore
         time_val = data.get("time")
         if isinstance(time_val, int):
             self.time = int(time_val)
+        self._dirty["rooms"].update(self.rooms)
+        self._dirty["item_states"].update(item_states)
+        self._dirty["npc_states"].update(npc_states)
+        self._version += 1
 
-    def _check_item_condition(self, cond: dict[str, Any]) -> bool:
-        item_id = cond.get("item")
-        if not item_id:
-            return False
-        state = cond.get("state")
-        if state is not None:
-            expected = state.value if isinstance(state, StateTag) else state
-            current = self.item_states.get(item_id)
-            if isinstance(current, StateTag):
-                current = current.value
-            if current != expected:
-                return False
-        location = cond.get("location")
-        if location:
-            if location is LocationTag.INVENTORY:
-                if item_id not in self.inventory:
-                    return False
-            elif location is LocationTag.CURRENT_ROOM:
-                room = self.rooms.get(self.current)
-                if not room or item_id not in room.items:
-                    return False
-            else:
-                room_id = location
-                room = self.rooms.get(room_id)
-                if not room or item_id not in room.items:
-                    return False
-        return True
-
-    def _check_npc_condition(self, cond: dict[str, Any]) -> bool:
-        npc_id = cond.get("npc")
-        state = cond.get("state")
-        if not npc_id or state is None:
-            return False
-        return self.npc_state(npc_id) == state
+    def _compiled_preconditions(self, pre: dict[str, Any]) -> _PreCheck:
+        entry = self._pre_checks.get(id(pre))
+        if entry is None or entry[0] is not pre:
+            entry = self._pre_checks[id(pre)] = (pre, _fuse_checks(_compile_preconditions(pre)))
+        return entry[1]
 
     def check_preconditions(self, pre: dict[str, Any] | None) -> bool:
         if not pre:
             return True
-        loc = pre.get("is_location")
-        if loc and self.current != (loc.value if isinstance(loc, LocationTag) else loc):
-            return False
-        item_cond = pre.get("item_conditions")
-        if item_cond:
-            for ic in item_cond:
-                if not self._check_item_condition(ic):
-                    return False
-        npc_met = pre.get("npc_met")
-        if npc_met and not self._check_npc_condition({"npc": npc_met, "state": StateTag.MET}):
-            return False
-        npc_help = pre.get("npc_help")
-        if npc_help and not self._check_npc_condition({"npc": npc_help, "state": StateTag.HELPED}):
-            return False
-        npc_state = pre.get("npc_state")
-        if npc_state and not self._check_npc_condition(npc_state):
-            return False
-        npc_conditions = pre.get("npc_conditions")
-        if npc_conditions:
-            for nc in npc_conditions:
-                if not self._check_npc_condition(nc):
-                    return False
-        return True
+        return self._compiled_preconditions(pre)(self)
 
     def apply_item_condition(self, cond: dict[str, Any]) -> None:
         item_id = cond.get("item")
@@ -461,22 +803,31 @@ class World:
         if location:
             if location is LocationTag.CURRENT_ROOM:
                 location = self.current
+            debug = self._debug_enabled
             if item_id in self.inventory:
                 self.inventory.remove(item_id)
-                self.debug(f"inventory {self.inventory}")
-            for room_id, room in self.rooms.items():
-                items = room.items
-                if item_id in items:
-                    items.remove(item_id)
-                    self.debug(f"room {room_id} items {items}")
+                if debug:
+                    self.debug(f"inventory {self.inventory}")
+            prev_id = self._item_location.pop(item_id, None)
+            self._mark_dirty("rooms", prev_id)
+            prev = self.rooms.get(prev_id) if prev_id else None
+            if prev is not None and item_id in prev.items:
+                prev.items.remove(item_id)
+                if debug:
+                    self.debug(f"room {prev_id} items {prev.items}")
             if location is LocationTag.INVENTORY:
                 self.inventory.append(item_id)
-                self.debug(f"inventory {self.inventory}")
+                if debug:
+                    self.debug(f"inventory {self.inventory}")
             else:
                 room_id = location
-                room = self.rooms.setdefault(room_id, Room(names=[], description=""))
+                room = self._ensure_room(room_id)
                 room.items.append(item_id)
-                self.debug(f"room {room_id} items {room.items}")
+                self._item_location[item_id] = room_id
+                self._mark_dirty("rooms", room_id)
+                if debug:
+                    self.debug(f"room {room_id} items {room.items}")
+            self._version += 1
 
     def apply_npc_condition(self, cond: dict[str, Any]) -> None:
         npc_id = cond.get("npc")
@@ -508,8 +859,6 @@ class World:
                 room = cfg.get("room")
                 target = cfg.get("target")
                 pre = cfg.get("preconditions")
-                if pre is not None and not isinstance(pre, dict):
-                    raise TypeError("preconditions must be a mapping")
                 if room and target:
                     duration = cfg.get("duration")
                     self.add_exit(room, target, pre, int(duration) if duration is not None else None)
@@ -524,22 +873,31 @@ class World:
 
         Does not include items/NPCs to allow callers to control output order.
         """
-        room = self.rooms[self.current]
-        desc = room.description
-        exits = room.exits
-        if exits:
-            exit_names = []
-            for cfg in exits.values():
-                names = cfg.get("names", [])
-                if names:
-                    exit_names.append(names[0])
-            exit_names.sort(key=lambda s: s.casefold())
-            if messages:
-                desc += " " + messages["exits"].format(exits=", ".join(exit_names))
-            else:  # pragma: no cover - fallback ohne messages
-                desc += " Exits: " + ", ".join(exit_names)
+        key = (self.current, self._version)
+        cached = self._header_cache
+        if cached is not None and cached[0] == key and cached[1] is messages:
+            return cached[2]
+        desc = self._room_header(messages)
+        self._header_cache = (key, messages, desc)
         return desc
 
+    def _room_header(self, messages: dict[str, str] | None) -> str:
+        room = self.rooms[self.current]
+        if not room.exits:
+            return room.description
+        exit_list = self._room_exit_list(room)
+        if messages:
+            return f"{room.description} {messages['exits'].format(exits=exit_list)}"
+        return f"{room.description} Exits: {exit_list}"  # pragma: no cover - fallback ohne messages
+
+    def _room_exit_list(self, room: Room) -> str:
+        key = (tuple(room.exits), self._version)
+        cached = room._exit_list
+        if cached is None or cached[0] != key:
+            names = sorted((cfg["names"][0] for cfg in room.exits.values() if cfg.get("names")), key=str.casefold)
+            cached = room._exit_list = (key, ", ".join(names))
+        return cached[1]
+
     def format_time(self) -> str:
         minutes = int(self.time) % 1440
         hh = minutes // 60
@@ -551,6 +909,15 @@ class World:
 
         Returns None if there is nothing visible.
         """
+        key = (self.current, self._version)
+        cached = self._visibility_cache
+        if cached is not None and cached[0] == key and cached[1] is messages:
+            return cached[2]
+        line = self._visibility(messages)
+        self._visibility_cache = (key, messages, line)
+        return line
+
+    def _visibility(self, messages: dict[str, str] | None) -> str | None:
         room = self.rooms[self.current]
         names: list[str] = []
         for item_id in room.items:
@@ -570,41 +937,24 @@ class World:
                 names.append(npc.names[0])
         if not names:
             return None
-        names.sort(key=lambda s: s.casefold())
+        names.sort(key=str.casefold)
         if messages and "you_see_here" in messages:
             return messages["you_see_here"].format(list=", ".join(names))
         return "You see here: " + ", ".join(names) + "."
 
     def describe_item(self, item_name: str) -> str | None:
-        item_name_cf = item_name.casefold()
-        room = self.rooms[self.current]
-        for item_id in room.items:
-            item = self.items.get(item_id)
-            if not item:
-                continue
-            names = self.item_names(item_id)
-            if any(name.casefold() == item_name_cf for name in names):
-                state = self.item_states.get(item_id)
-                if state:
-                    state_key = state.value if isinstance(state, StateTag) else state
-                    desc = item.states.get(state_key, {}).get("description")
-                    if desc is not None:
-                        return desc
-                return item.description
-        for item_id in self.inventory:
-            item = self.items.get(item_id)
-            if not item:
-                continue
-            names = self.item_names(item_id)
-            if any(name.casefold() == item_name_cf for name in names):
-                state = self.item_states.get(item_id)
-                if state:
-                    state_key = state.value if isinstance(state, StateTag) else state
-                    desc = item.states.get(state_key, {}).get("description")
-                    if desc is not None:
-                        return desc
-                return item.description
-        return None
+        item_id = self.find_room_item(item_name) or self.find_inventory_item(item_name)
+        return self.item_description(item_id) if item_id else None
+
+    def item_description(self, item_id: str) -> str | None:
+        """Return the state-specific description of an item, falling back to its base description."""
+        item = self.items[item_id]
+        state = item.state
+        if state:
+            desc = item.states.get(state, {}).get("description")
+            if desc is not None:
+                return desc
+        return item.description
 
     def describe_npc(self, npc_name: str) -> str | None:
         """Return a description for an NPC in the current room.
@@ -624,115 +974,116 @@ class World:
             pre = npc.meet.get("preconditions")
             if pre and not self.check_preconditions(pre):
                 continue
-            names = npc.names or []
-            if not any(name.casefold() == npc_name_cf for name in names):
+            if npc_name_cf not in npc.names_cf:
                 continue
-            state = self.npc_state(npc_id)
-            state_key = state.value if isinstance(state, StateTag) else state
-            cfg = (npc.states or {}).get(state_key or "", {})
+            cfg = (npc.states or {}).get(self.npc_state(npc_id) or "", {})
             # Prefer explicit examine description, fallback to generic text
             desc = cfg.get("examine") or cfg.get("text")
             return desc
         return None
 
     def move(self, exit_name: str) -> bool:
-        room = self.rooms[self.current]
-        exits = room.exits
-        exit_name_cf = exit_name.casefold()
-        for target, cfg in exits.items():
-            names = cfg.get("names", [])
-            if any(name.casefold() == exit_name_cf for name in names):
-                self.current = target
-                self.debug(f"location {self.current}")
-                return True
-        return False
+        target = self.find_exit(exit_name)
+        if target is None:
+            return False
+        self.current = target
+        if self._debug_enabled:
+            self.debug(f"location {self.current}")
+        return True
 
     def has_room(self, name: str) -> bool:
         if not name:
             return False
-        name_cf = name.casefold()
-        for room in self.rooms.values():
-            room_names_cf = (n.casefold() for n in room.names)
-            if name_cf in room_names_cf:
-                return True
-        return False
+        return self.find_room(name) is not None
 
     def can_move(self, exit_name: str) -> bool:
-        room = self.rooms[self.current]
-        exits = room.exits
-        exit_name_cf = exit_name.casefold()
-        for cfg in exits.values():
-            names = cfg.get("names", [])
-            if any(name.casefold() == exit_name_cf for name in names):
-                pre = cfg.get("preconditions")
-                return self.check_preconditions(pre)
-        return False
+        target = self.find_exit(exit_name)
+        if target is None:
+            return False
+        return self.check_preconditions(self.rooms[self.current].exits[target].get("preconditions"))
 
     def add_exit(self, room_id: str, target: str, pre: dict[str, Any] | None = None, duration: int | None = None) -> None:
-        room = self.rooms.setdefault(room_id, Room(names=[], description=""))
+        target = sys.intern(target)
+        room = self._ensure_room(room_id)
         exits = room.exits
         target_room = self.rooms.get(target)
-        names = target_room.names if target_room else [target]
-        exits[target] = {"names": names}
+        if target_room:
+            exits[target] = {"names": target_room.names, "names_cf": target_room.names_cf}
+        else:
+            exits[target] = _exit_entry([target])
         if pre:
             exits[target]["preconditions"] = pre
         if duration is not None:
             exits[target]["duration"] = int(duration)
-        self.debug(f"add_exit {room_id}->{target}")
+        self._mark_dirty("exits", room_id)
+        self._version += 1
+        if self._debug_enabled:
+            self.debug(f"add_exit {room_id}->{target}")
 
     # --- time management helpers ---
     def get_exit_duration(self, exit_name: str) -> int:
-        room = self.rooms[self.current]
-        exit_name_cf = exit_name.casefold()
-        for cfg in room.exits.values():
-            names = cfg.get("names", [])
-            if any(name.casefold() == exit_name_cf for name in names):
-                dur = cfg.get("duration")
-                return int(dur) if isinstance(dur, int) else 1
-        return 1
+        target = self.find_exit(exit_name)
+        if target is None:
+            return 1
+        dur = self.rooms[self.current].exits[target].get("duration")
+        return int(dur) if isinstance(dur, int) else 1
 
     def advance_time(self, units: int) -> None:
-        if units and units > 0:
-            self.time = (self.time + int(units)) % 1440
-            self.debug(f"time +{units} -> {self.time}")
+        if units > 0:
+            self.time = (self.time + units) % 1440
+            if self._debug_enabled:
+                self.debug(f"time +{units} -> {self.time}")
 
     def take(self, item_name: str) -> str | None:
         """Move an item from the current room into the inventory.
 
         Returns the canonical item name if the item was taken, otherwise ``None``.
         """
-        room = self.rooms[self.current]
-        items = room.items
-        item_name_cf = item_name.casefold()
-        for item_id in list(items):
-            names = self.item_names(item_id)
-            if any(name.casefold() == item_name_cf for name in names):
-                items.remove(item_id)
-                self.inventory.append(item_id)
-                self.debug(f"room {self.current} items {items}")
-                self.debug(f"inventory {self.inventory}")
-                if names:
-                    return names[0]
-                return item_name
-        return None
+        item_id = self.find_room_item(item_name)
+        if not item_id:
+            return None
+        items = self.rooms[self.current].items
+        items.remove(item_id)
+        self._item_location.pop(item_id, None)
+        self._mark_dirty("rooms", self.current)
+        self.inventory.append(item_id)
+        self._version += 1
+        if self._debug_enabled:
+            self.debug(f"room {self.current} items {items}")
+            self.debug(f"inventory {self.inventory}")
+        names = self.item_names(item_id)
+        if names:
+            return names[0]
+        return item_name
+
+    def remove_from_inventory(self, item_id: str) -> None:
+        """Remove a carried item from the game."""
+        self.inventory.remove(item_id)
+        self._version += 1
+        if self._debug_enabled:
+            self.debug(f"inventory {self.inventory}")
 
     def drop(self, item_name: str) -> bool:
-        item_name_cf = item_name.casefold()
-        for item_id in list(self.inventory):
-            names = self.item_names(item_id)
-            if any(name.casefold() == item_name_cf for name in names):
-                self.inventory.remove(item_id)
-                room = self.rooms[self.current]
-                room.items.append(item_id)
-                self.debug(f"inventory {self.inventory}")
-                self.debug(f"room {self.current} items {room.items}")
-                return True
-        return False
+        item_id = self.find_inventory_item(item_name)
+        if not item_id:
+            return False
+        self.inventory.remove(item_id)
+        room = self.rooms[self.current]
+        room.items.append(item_id)
+        self._item_location[item_id] = self.current
+        self._mark_dirty("rooms", self.current)
+        self._version += 1
+        if self._debug_enabled:
+            self.debug(f"inventory {self.inventory}")
+            self.debug(f"room {self.current} items {room.items}")
+        return True
 
     def add_npc_to_location(self, npc_id: str, location: str) -> None:
-        room = self.rooms.setdefault(location, Room(names=[], description=""))
+        room = self._ensure_room(location)
         if npc_id not in room.occupants:
             room.occupants.append(npc_id)
+        self._npc_location[npc_id] = location
+        self._version += 1
 
     def remove_npc_from_location(self, npc_id: str, location: str | None) -> None:
         if not location:
@@ -740,14 +1091,19 @@ class World:
         room = self.rooms.get(location)
         if room and npc_id in room.occupants:
             room.occupants.remove(npc_id)
+        if self._npc_location.get(npc_id) == location:
+            del self._npc_location[npc_id]
+        self._version += 1
 
     def move_npc(self, npc_id: str, location: str) -> None:
         if npc_id not in self.npcs:
             return
-        for room in self.rooms.values():
-            if npc_id in room.occupants:
-                room.occupants.remove(npc_id)
-                break
+        old = self._npc_location.get(npc_id)
+        if old == location:
+            return
+        room = self.rooms.get(old) if old else None
+        if room is not None and npc_id in room.occupants:
+            room.occupants.remove(npc_id)
         self.add_npc_to_location(npc_id, location)
 
     def set_item_state(self, item_id: str, state: str) -> bool:
@@ -760,9 +1116,11 @@ class World:
         states = item.states
         if not states or state not in states:
             return False
-        self.item_states[item_id] = state
         item.state = state
-        self.debug(f"item {item_id} state {state}")
+        self._mark_dirty("item_states", item_id)
+        self._version += 1
+        if self._debug_enabled:
+            self.debug(f"item {item_id} state {state}")
         return True
 
     def set_npc_state(self, npc_id: str, state: str | StateTag) -> bool:
@@ -773,13 +1131,14 @@ class World:
         if not npc:
             return False
         states = npc.states
-        state_key = state.value if isinstance(state, StateTag) else state
-        if not states or state_key not in states:
+        if not states or state not in states:
             return False
-        value = StateTag(state_key) if state_key in StateTag._value2member_map_ else state_key
-        self.npc_states[npc_id] = value
-        npc.state = value
-        self.debug(f"npc {npc_id} state {state_key}")
+        state = str(state)
+        npc.state = state
+        self._mark_dirty("npc_states", npc_id)
+        self._version += 1
+        if self._debug_enabled:
+            self.debug(f"npc {npc_id} state {state}")
         return True
 
     def meet_npc(self, npc_id: str) -> bool:
@@ -787,37 +1146,51 @@ class World:
         npc = self.npcs.get(npc_id)
         if not npc:
             return False
-        state = self.npc_states.get(npc_id)
-        if state != "unknown":
+        if npc.state != "unknown":
             return False
         states = npc.states
-        if StateTag.MET.value not in states:
+        if StateTag.MET not in states:
             return False
-        self.npc_states[npc_id] = StateTag.MET
-        npc.state = StateTag.MET
-        self.debug(f"npc {npc_id} state {StateTag.MET.value}")
+        npc.state = StateTag.MET.value
+        self._mark_dirty("npc_states", npc_id)
+        self._version += 1
+        if self._debug_enabled:
+            self.debug(f"npc {npc_id} state {StateTag.MET}")
         return True
 
-    def npc_state(self, npc_id: str) -> str | StateTag | None:
+    def npc_state(self, npc_id: str) -> str | None:
         """Return the current state of an NPC."""
-        return self.npc_states.get(npc_id)
+        npc = self.npcs.get(npc_id)
+        return npc.state if npc is not None else None
+
+    @property
+    def item_states(self) -> dict[str, str]:
+        """Snapshot of item id -> state for items that have one; the models hold the state."""
+        return {item_id: item.state for item_id, item in self.items.items() if item.state is not None}
+
+    @property
+    def npc_states(self) -> dict[str, str]:
+        """Snapshot of NPC id -> state for NPCs that have one; the models hold the state."""
+        return {npc_id: npc.state for npc_id, npc in self.npcs.items() if npc.state is not None}
 
     def describe_inventory(self, messages: dict[str, str]) -> str:
         if not self.inventory:
             return messages["inventory_empty"]
-        item_names: list[str] = []
-        for i in self.inventory:
-            names = self.item_names(i)
-            if names:
-                item_names.append(names[0])
-            else:
-                item = self.items.get(i)
-                item_names.append(item.names[0] if item and item.names else i)
-        return messages["inventory_items"].format(items=", ".join(item_names))
+        item_names = self.item_names
+        names = [(item_names(i) or (i,))[0] for i in self.inventory]
+        return messages["inventory_items"].format(items=", ".join(names))
 
     def check_endings(self) -> str | None:
-        for ending in self.endings.values():
+        key = (self.current, self._version)
+        cached = self._endings_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        result = None
+        buckets = self._endings_by_loc
+        for ending in buckets.get(self.current) or buckets[None]:
             pre = ending.get("preconditions")
             if self.check_preconditions(pre):
-                return ending.get("description")
-        return None
+                result = ending.get("description")
+                break
+        self._endings_cache = (key, result)
+        return result
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from enum import Enum
+import sys
+from collections.abc import Iterable
+from enum import Enum, StrEnum
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+
+def casefold_names(names: Iterable[str]) -> tuple[str, ...]:
+    """Casefold ``names``, interning the results so equal names share one string."""
+    return tuple(sys.intern(n.casefold()) for n in names)
 
 
 class LocationTag(Enum):
@@ -13,7 +21,7 @@ class LocationTag(Enum):
     CURRENT_ROOM = "CURRENT_ROOM"
 
 
-class StateTag(Enum):
+class StateTag(StrEnum):
     MET = "met"
     HELPED = "helped"
 
@@ -36,9 +44,20 @@ class Room(BaseModel):
     forms: dict[str, str] | None = None
     # Optional generic move marker: value + position (before|after|suffix) and optional use_form key
     move_marker: dict[str, Any] | None = None
+    # Cached casefolded-name -> item id lookup, keyed on the item list and World name version
+    _name_index: tuple[tuple[tuple[str, ...], int], dict[str, str]] | None = PrivateAttr(default=None)
+    # Cached casefolded exit name -> target room id lookup, keyed the same way on the exit targets
+    _exit_index: tuple[tuple[tuple[str, ...], int], dict[str, str]] | None = PrivateAttr(default=None)
+    # Cached sorted, comma-joined exit display names, keyed like the exit index
+    _exit_list: tuple[tuple[tuple[str, ...], int], str] | None = PrivateAttr(default=None)
 
     model_config = ConfigDict(extra="forbid")
 
+    @cached_property
+    def names_cf(self) -> tuple[str, ...]:
+        """Casefolded names for case-insensitive lookups."""
+        return casefold_names(self.names)
+
     def get(self, key: str, default: Any = None) -> Any:
         return getattr(self, key, default)
 
@@ -59,7 +78,7 @@ class Room(BaseModel):
 class Item(BaseModel):
     names: list[str]
     description: str | None = None
-    state: str | StateTag | None = None
+    state: str | None = None
     states: dict[str, dict[str, Any]] = Field(default_factory=dict)  # noqa
     # Optional language-specific forms of the item name (e.g., accusative)
     forms: dict[str, str] | None = None
@@ -68,6 +87,11 @@ class Item(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
+    @cached_property
+    def names_cf(self) -> tuple[str, ...]:
+        """Casefolded names for case-insensitive lookups."""
+        return casefold_names(self.names)
+
     def get(self, key: str, default: Any = None) -> Any:
         return getattr(self, key, default)
 
@@ -93,13 +117,18 @@ class DialogNode(BaseModel):
 
 class Npc(BaseModel):
     names: list[str]
-    state: str | StateTag | None = None
+    state: str | None = None
     states: dict[str, dict[str, Any]] = Field(default_factory=dict)  # noqa
     meet: dict[str, Any] = Field(default_factory=dict)  # noqa
     dialog: dict[str, DialogNode] = Field(default_factory=dict)  # noqa
 
     model_config = ConfigDict(extra="forbid")
 
+    @cached_property
+    def names_cf(self) -> tuple[str, ...]:
+        """Casefolded names for case-insensitive lookups."""
+        return casefold_names(self.names)
+
     def get(self, key: str, default: Any = None) -> Any:
         return getattr(self, key, default)
 
@@ -0,0 +1,89 @@
+"""YAML helpers that use the libyaml bindings when available."""
+
+import json
+import os
+import pickle
+import sys
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from pathlib import Path
+from typing import IO, Any
+
+import yaml
+
+_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_DUMPER: Any = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# Layout of the files written by cached(); bump it whenever that layout changes
+_CACHE_FORMAT = 1
+
+
+def safe_load(stream: str | bytes | IO[str]) -> Any:
+    """Parse YAML like :func:`yaml.safe_load`."""
+    return yaml.load(stream, Loader=_LOADER)  # noqa: S506 - safe loader
+
+
+def safe_dump(data: Any, stream: IO[str] | None = None) -> str | None:
+    """Serialize YAML like :func:`yaml.safe_dump`."""
+    return yaml.dump(data, stream, Dumper=_DUMPER)
+
+
+def cache_dir() -> Path:
+    """Per-user directory for derived caches; ``HDA_CACHE_DIR`` overrides it."""
+    override = os.environ.get("HDA_CACHE_DIR")
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "herrschaft-der-asche"
+
+
+def load_path(path: str | Path) -> Any:
+    """Parse the YAML file at ``path`` from its raw bytes, skipping Python-side stream reads."""
+    return safe_load(Path(path).read_bytes())
+
+
+def load_save(path: str | Path) -> Any:
+    """Read a save file written by :func:`dump_save`, falling back to YAML for older saves."""
+    raw = Path(path).read_bytes()
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return safe_load(raw)
+
+
+def dump_save(data: Any, path: str | Path) -> None:
+    """Write save data as compact JSON, which YAML readers still accept."""
+    Path(path).write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+
+def cached(cache_path: str | Path, sources: Iterable[str | Path], build: Callable[[], Any], *, version: str = "") -> Any:
+    """Return ``build()``, reusing a pickled result at ``cache_path`` while ``sources`` are unchanged.
+
+    The cache is keyed on the cache format, ``version`` and the sources' paths,
+    mtimes and sizes; callers list the code that shapes ``build()``'s result among
+    ``sources`` or bump ``version`` when it changes. The key is stored as a JSON
+    header line and compared before the pickled payload is touched. Failing to
+    read or write the cache only costs a call to ``build``.
+    """
+    paths = [os.fspath(source) for source in sources]
+    stats = [(path, st.st_mtime_ns, st.st_size) for path, st in zip(paths, map(os.stat, paths), strict=True)]
+    header = json.dumps([_CACHE_FORMAT, version, stats]).encode() + b"\n"
+    with suppress(Exception), open(cache_path, "rb") as fh:
+        if fh.readline() == header:
+            return pickle.load(fh)  # noqa: S301 - only after the header matched the sources
+    data = build()
+    tmp_path = f"{os.fspath(cache_path)}.{os.getpid()}.tmp"
+    with suppress(OSError):
+        os.makedirs(os.path.dirname(tmp_path) or ".", exist_ok=True)
+        with open(tmp_path, "wb") as fh:
+            fh.write(header)
+            pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    return data
+
+
+__all__ = ["safe_load", "safe_dump", "load_path", "load_save", "dump_save", "cache_dir", "cached"]
@@ -5,7 +5,9 @@ import sys
 from pathlib import Path
 
 from engine.game import run
-from engine.llm import OllamaLLM
+
+# Buffer size for the --debug log file, which receives both the STDOUT copy and all STDERR debug output
+_LOG_BUFFER_SIZE = 64 * 1024
 
 
 def run_cli() -> None:
@@ -65,16 +67,16 @@ def run_cli() -> None:
     args = parser.parse_args()
     cli_lang = args.language or "de"
     data_path = Path(__file__).parent.parent / "data" / cli_lang / f"world.{cli_lang}.yaml"
-    llm = (
-        OllamaLLM(
+    llm = None
+    if args.llm:
+        from engine.llm import OllamaLLM
+
+        llm = OllamaLLM(
             model=args.llm_model,
             base_url=args.llm_base_url,
             timeout=args.llm_timeout,
             check_model=True,
         )
-        if args.llm
-        else None
-    )
     debug_opt = args.debug
 
     if isinstance(debug_opt, str):  # --debug FILE provided
@@ -120,7 +122,7 @@ def run_cli() -> None:
             def encoding(self) -> str:  # pragma: no cover - compatibility
                 return getattr(self._file, "encoding", "utf-8")
 
-        with open(debug_opt, "w", encoding="utf-8") as fh:
+        with open(debug_opt, "w", encoding="utf-8", buffering=_LOG_BUFFER_SIZE) as fh:
             try:
                 sys.stdout = _TeeStdout(orig_stdout, fh)
                 sys.stderr = _OnlyFile(fh)
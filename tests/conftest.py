@@ -1,8 +1,9 @@
+import shutil
 import sys
 from pathlib import Path
 
 import pytest
-import yaml
+from engine import yaml_io
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
@@ -31,6 +32,17 @@ class DummyLLM(LLMBackend):
         return None
 
 
+@pytest.fixture(scope="session")
+def _cache_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(_cache_dir, monkeypatch):
+    """Keep the world caches written by tests out of the user's cache directory."""
+    monkeypatch.setenv("HDA_CACHE_DIR", str(_cache_dir))
+
+
 @pytest.fixture
 def io_backend() -> DummyIO:
     return DummyIO()
@@ -41,8 +53,10 @@ def llm_backend() -> DummyLLM:
     return DummyLLM()
 
 
-@pytest.fixture
-def data_dir(tmp_path):
+@pytest.fixture(scope="session")
+def _data_template(tmp_path_factory):
+    """Write the sample world once per session; ``data_dir`` hands out copies."""
+    root = tmp_path_factory.mktemp("data_template")
     generic = {
         "items": {
             "sword": {},
@@ -161,14 +175,20 @@ def data_dir(tmp_path):
         "endings": {"green_gem": "Das Juwel ist grün."},
     }
 
-    (tmp_path / "generic").mkdir()
-    with open(tmp_path / "generic" / "world.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(generic, fh)
+    (root / "generic").mkdir()
+    with open(root / "generic" / "world.yaml", "w", encoding="utf-8") as fh:
+        yaml_io.safe_dump(generic, fh)
 
     for lang, data in {"en": en, "de": de}.items():
-        lang_dir = tmp_path / lang
+        lang_dir = root / lang
         lang_dir.mkdir()
         with open(lang_dir / f"world.{lang}.yaml", "w", encoding="utf-8") as fh:
-            yaml.safe_dump(data, fh)
+            yaml_io.safe_dump(data, fh)
+
+    return root
 
+
+@pytest.fixture
+def data_dir(_data_template, tmp_path):
+    shutil.copytree(_data_template, tmp_path, dirs_exist_ok=True)
     return tmp_path
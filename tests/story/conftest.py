@@ -0,0 +1,22 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture(scope="session")
+def _story_template(_data_template, tmp_path_factory):
+    """Overlay the real story world on the sample data once per session."""
+    root = tmp_path_factory.mktemp("story_template")
+    shutil.copytree(_data_template, root, dirs_exist_ok=True)
+    shutil.copy(ROOT_DIR / "data" / "generic" / "world.yaml", root / "generic" / "world.yaml")
+    shutil.copy(ROOT_DIR / "data" / "en" / "world.en.yaml", root / "en" / "world.en.yaml")
+    return root
+
+
+@pytest.fixture
+def data_dir(_story_template, tmp_path):
+    shutil.copytree(_story_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
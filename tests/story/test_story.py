@@ -1,23 +1,32 @@
-import shutil
-from pathlib import Path
-
-import yaml
-from engine import game
-
-
-def _project_root(file: str) -> Path:
-    p = Path(file).resolve()
-    return p.parents[2] if p.parents[1].name == "tests" else p.parents[1]
-
-
-def copy_story_world(data_dir) -> None:
-    root = _project_root(__file__)
-    shutil.copy(root / "data" / "generic" / "world.yaml", data_dir / "generic" / "world.yaml")
-    shutil.copy(root / "data" / "en" / "world.en.yaml", data_dir / "en" / "world.en.yaml")
+from engine import game, yaml_io
+
+# Walkthrough to the crown_returned ending, as (command handler, *arguments)
+ENDING_WALKTHROUGH: tuple[tuple[str, ...], ...] = (
+    ("cmd_take", "Small Key"),
+    ("cmd_go", "Forest"),
+    ("cmd_go", "Ash Village"),
+    ("cmd_talk", "Villager"),
+    ("cmd_say", "M2"),
+    ("cmd_take", "Map Fragment"),
+    ("cmd_go", "Forest"),
+    ("cmd_talk", "Ashram"),
+    ("cmd_say", "A1"),
+    ("cmd_show", "Map Fragment", "Ashram"),
+    # Optionally examine the map after interpretation
+    ("cmd_examine", "Map Fragment"),
+    ("cmd_go", "Hut"),
+    ("cmd_go", "Ruins"),
+    ("cmd_use", "Small Key", "Locked Chest"),
+    # After unlocking, examine the opened Chest to obtain the crown
+    ("cmd_examine", "Chest"),
+    # Return via Hut -> Forest -> Ash Village
+    ("cmd_go", "Hut"),
+    ("cmd_go", "Forest"),
+    ("cmd_go", "Ash Village"),
+)
 
 
 def test_ruins_inaccessible_without_map(data_dir, io_backend):
-    copy_story_world(data_dir)
     g = game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
     g.command_processor.cmd_go("Forest")
     assert g.world.current == "forest"
@@ -42,9 +51,8 @@ def test_ruins_inaccessible_without_map(data_dir, io_backend):
 
 
 def test_examine_closed_chest_reveals_no_crown(data_dir, io_backend):
-    copy_story_world(data_dir)
     with open(data_dir / "en" / "world.en.yaml", encoding="utf-8") as fh:
-        en = yaml.safe_load(fh)
+        en = yaml_io.safe_load(fh)
 
     closed_desc = en["items"]["chest"]["states"]["closed"]["description"]
     open_success = en["actions"]["open_chest"]["messages"]["success"]
@@ -77,37 +85,14 @@ def test_examine_closed_chest_reveals_no_crown(data_dir, io_backend):
 
 
 def test_game_reaches_ending(data_dir, io_backend):
-    copy_story_world(data_dir)
     with open(data_dir / "en" / "world.en.yaml", encoding="utf-8") as fh:
-        en = yaml.safe_load(fh)
+        en = yaml_io.safe_load(fh)
     ending_text = en["endings"]["crown_returned"]
 
     g = game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
 
     cp = g.command_processor
-    commands = [
-        lambda: cp.cmd_take("Small Key"),
-        lambda: cp.cmd_go("Forest"),
-        lambda: cp.cmd_go("Ash Village"),
-        lambda: (cp.cmd_talk("Villager"), cp.cmd_say("M2"))[1],
-        lambda: cp.cmd_take("Map Fragment"),
-        lambda: cp.cmd_go("Forest"),
-        lambda: (cp.cmd_talk("Ashram"), cp.cmd_say("A1"))[1],
-        lambda: cp.cmd_show("Map Fragment", "Ashram"),
-        # Optionally examine the map after interpretation
-        lambda: cp.cmd_examine("Map Fragment"),
-        lambda: cp.cmd_go("Hut"),
-        lambda: cp.cmd_go("Ruins"),
-        lambda: cp.cmd_use("Small Key", "Locked Chest"),
-        # After unlocking, examine the opened Chest to obtain the crown
-        lambda: cp.cmd_examine("Chest"),
-        # Return via Hut -> Forest -> Ash Village
-        lambda: cp.cmd_go("Hut"),
-        lambda: cp.cmd_go("Forest"),
-        lambda: cp.cmd_go("Ash Village"),
-    ]
-
-    for func in commands:
-        func()
+    for name, *args in ENDING_WALKTHROUGH:
+        getattr(cp, name)(*args)
 
     assert io_backend.outputs[-1] == ending_text
@@ -1,5 +1,5 @@
 import pytest
-from engine.world import World
+from engine.world import World, WorldDataError
 from pydantic import ValidationError
 
 
@@ -20,3 +20,9 @@ def test_invalid_action_preconditions():
 def test_invalid_action_effect():
     with pytest.raises(ValidationError):
         make_world({"effect": []})
+
+
+def test_invalid_add_exit_preconditions_rejected_at_load():
+    effect = {"add_exits": [{"room": "room", "target": "room", "preconditions": []}]}
+    with pytest.raises(WorldDataError):
+        make_world({"trigger": "use", "item": "key", "effect": effect})
@@ -1,6 +1,5 @@
 import pytest
-import yaml
-from engine import game, parser
+from engine import game, parser, yaml_io
 
 
 def test_save_on_eoferror(data_dir, monkeypatch, io_backend):
@@ -14,7 +13,7 @@ def test_save_on_eoferror(data_dir, monkeypatch, io_backend):
     save_path = data_dir / "save.yaml"
     assert save_path.exists()
     with open(save_path, encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+        data = yaml_io.safe_load(fh)
     assert data["current"] == "start"
 
 
@@ -1,6 +1,6 @@
-import os
+import builtins
+import importlib.util
 import shutil
-import subprocess
 import sys
 from pathlib import Path
 
@@ -10,23 +10,22 @@ def _project_root(file: str) -> Path:
     return p.parents[2] if p.parents[1].name == "tests" else p.parents[1]
 
 
-def test_cli_module_entry(data_dir, tmp_path):
+def _raise_eof(*_args) -> str:
+    raise EOFError
+
+
+def test_cli_module_entry(data_dir, tmp_path, monkeypatch, capsys):
     game_dir = tmp_path / "game"
     game_dir.mkdir()
     main_src = _project_root(__file__) / "game" / "main.py"
     shutil.copy(main_src, game_dir / "main.py")
-    (game_dir / "__init__.py").write_text("")
     shutil.copytree(data_dir, tmp_path / "data")
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(_project_root(__file__))
-    result = subprocess.run(  # noqa: S603
-        [sys.executable, "-m", "game.main", "--language", "en"],
-        input="",
-        text=True,
-        cwd=tmp_path,
-        env=env,
-        capture_output=True,
-        check=False,
-    )
-    assert result.returncode == 0
-    assert "Room 1." in result.stdout
+    # Load the copy so run_cli resolves its data directory next to it, as `python -m game.main` would
+    spec = importlib.util.spec_from_file_location("_cli_main", game_dir / "main.py")
+    assert spec is not None and spec.loader is not None
+    main = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(main)
+    monkeypatch.setattr(sys, "argv", ["game.main", "--language", "en"])
+    monkeypatch.setattr(builtins, "input", _raise_eof)
+    main.run_cli()
+    assert "Room 1." in capsys.readouterr().out
@@ -11,3 +11,14 @@ def test_too_many_arguments(data_dir, io_backend):
     g = game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
     ok = g.command_processor.execute("inventory extra")
     assert ok is False
+
+
+def test_command_buckets_keep_pattern_order(data_dir, io_backend):
+    g = game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
+    cp = g.command_processor
+    order = {id(p): i for i, p in enumerate(cp.cmd_patterns)}
+    for word, bucket in cp._cmd_buckets.items():
+        positions = [order[id(p)] for p in bucket]
+        assert positions == sorted(positions)
+        assert all(entry.split()[0] in (word, "$a", "$b") for _, _, entry in bucket)
+    assert cp.execute("inventory")
@@ -17,3 +17,14 @@ def test_dynamic_exit_save_and_load(data_dir, tmp_path):
     assert not new.can_move(target_id)
     new.load_state(save_path)
     assert new.can_move(target_id)
+
+
+def test_find_exit_follows_added_exits(data_dir):
+    w = World.from_files(data_dir / "generic/world.yaml", data_dir / "en/world.en.yaml")
+    assert w.find_exit("ROOM 2") == "room2"
+    assert w.find_exit("room3") is None
+    w.add_exit("start", "room4", duration=3)
+    assert w.find_exit("ROOM4") == "room4"
+    assert w.get_exit_duration("room4") == 3
+    assert w.move("room4")
+    assert w.current == "room4"
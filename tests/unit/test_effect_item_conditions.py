@@ -16,3 +16,18 @@ def test_apply_effect_multiple_item_conditions(data_dir):
     assert g.world.item_states["gem"] == "green"
     assert "sword" in g.world.inventory
     assert "sword" not in g.world.rooms["room3"]["items"]
+
+
+def test_item_condition_moves_dropped_item(data_dir):
+    g = game.Game(str(data_dir / "en" / "world.en.yaml"), "en")
+    w = g.world
+    assert w.move("Room 3")
+    assert w.take("Sword")
+    assert w.move("Room 1")
+    assert w.drop("Sword")
+    w.apply_item_condition({"item": "sword", "location": "room2"})
+    assert "sword" not in w.rooms["start"].items
+    assert w.rooms["room2"].items == ["gem", "sword"]
+    w.apply_item_condition({"item": "sword", "location": LocationTag.CURRENT_ROOM})
+    assert w.rooms["start"].items == ["sword"]
+    assert w.rooms["room2"].items == ["gem"]
@@ -1,5 +1,5 @@
-import yaml
-from engine import game
+from engine import game, yaml_io
+from engine.world import World
 from engine.world_model import LocationTag
 
 
@@ -34,9 +34,9 @@ def test_end_condition_inventory_and_location(data_dir, io_backend):
         "endings": {"win": "You win!"},
     }
     with open(data_dir / "generic" / "world.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(generic, fh)
+        yaml_io.safe_dump(generic, fh)
     with open(data_dir / "en" / "world.en.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(en, fh)
+        yaml_io.safe_dump(en, fh)
     g = game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
     g.command_processor.cmd_take("Crown")
     g.command_processor.cmd_go("Room2")
@@ -69,9 +69,9 @@ def test_end_condition_inventory_lacks(data_dir, io_backend):
         "endings": {"fail": "No crown, no victory."},
     }
     with open(data_dir / "generic" / "world.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(generic, fh)
+        yaml_io.safe_dump(generic, fh)
     with open(data_dir / "en" / "world.en.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(en, fh)
+        yaml_io.safe_dump(en, fh)
     g = game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
     g.command_processor.cmd_go("Room2")
     assert io_backend.outputs[-1] == "No crown, no victory."
@@ -103,9 +103,9 @@ def test_end_condition_or_room_has(data_dir, io_backend):
         "endings": {"done": "You see the sword and know your quest is over."},
     }
     with open(data_dir / "generic" / "world.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(generic, fh)
+        yaml_io.safe_dump(generic, fh)
     with open(data_dir / "en" / "world.en.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(en, fh)
+        yaml_io.safe_dump(en, fh)
     g = game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
     g.command_processor.cmd_go("Room2")
     assert io_backend.outputs[-1] == "You see the sword and know your quest is over."
@@ -118,3 +118,37 @@ def test_end_condition_item_state(data_dir, io_backend):
     assert g.world.set_item_state("gem", "green")
     g._check_end()
     assert io_backend.outputs[-1] == "The gem is green."
+
+
+def _world_with_endings(endings):
+    rooms = {
+        "room1": {"names": ["Room1"], "description": "Room1"},
+        "room2": {"names": ["Room2"], "description": "Room2"},
+    }
+    return World({"rooms": rooms, "start": "room1", "endings": endings})
+
+
+def test_endings_keep_declaration_order_across_locations():
+    anywhere = {"description": "anywhere"}
+    here = {"preconditions": {"is_location": "room1"}, "description": "here"}
+    assert _world_with_endings({"anywhere": anywhere, "here": here}).check_endings() == "anywhere"
+    w = _world_with_endings({"here": here, "anywhere": anywhere})
+    assert w.check_endings() == "here"
+    w.current = "room2"
+    assert w.check_endings() == "anywhere"
+
+
+def test_cached_ending_follows_inventory_changes():
+    data = {
+        "items": {"sword": {"names": ["Sword"]}},
+        "rooms": {"room1": {"names": ["Room1"], "description": "Room1", "items": ["sword"]}},
+        "start": "room1",
+        "endings": {"won": {"preconditions": {"item_conditions": [{"item": "sword", "location": "INVENTORY"}]}, "description": "won"}},
+    }
+    w = World(data)
+    assert w.check_endings() is None
+    assert w.check_endings() is None
+    assert w.take("Sword")
+    assert w.check_endings() == "won"
+    assert w.drop("Sword")
+    assert w.check_endings() is None
@@ -1,5 +1,5 @@
 import pytest
-from engine import game
+from engine import game, yaml_io
 
 
 def test_game_init_missing_world(data_dir, io_backend):
@@ -17,6 +17,17 @@ def test_game_init_corrupted_world(data_dir, io_backend):
     assert any("Invalid world file" in o for o in io_backend.outputs)
 
 
+def test_game_init_invalid_world_data(data_dir, io_backend):
+    path = data_dir / "generic" / "world.yaml"
+    generic = yaml_io.load_path(path)
+    generic["actions"]["cut_gem"]["effect"]["add_exits"] = [{"room": "start", "target": "room2", "preconditions": []}]
+    with open(path, "w", encoding="utf-8") as fh:
+        yaml_io.safe_dump(generic, fh)
+    with pytest.raises(SystemExit):
+        game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
+    assert any("Invalid world file" in o for o in io_backend.outputs)
+
+
 def test_game_init_corrupted_save(data_dir, io_backend):
     with open(data_dir / "save.yaml", "w", encoding="utf-8") as fh:
         fh.write("- : - invalid yaml")
@@ -1,15 +1,14 @@
 import pytest
-import yaml
-from engine import game, integrity, world
+from engine import game, integrity, world, yaml_io
 
 
 def test_invalid_exit_causes_error(data_dir, capsys):
     generic_world_path = data_dir / "generic" / "world.yaml"
     with open(generic_world_path, encoding="utf-8") as fh:
-        world_data = yaml.safe_load(fh)
+        world_data = yaml_io.safe_load(fh)
     world_data["rooms"]["start"]["exits"].append("nowhere")
     with open(generic_world_path, "w", encoding="utf-8") as fh:
-        yaml.safe_dump(world_data, fh)
+        yaml_io.safe_dump(world_data, fh)
 
     with pytest.raises(SystemExit):
         game.Game(str(data_dir / "en" / "world.en.yaml"), "en")
@@ -20,7 +19,7 @@ def test_invalid_exit_causes_error(data_dir, capsys):
 def test_invalid_save_reference_leaves_file(data_dir, capsys):
     save_path = data_dir / "save.yaml"
     with open(save_path, "w", encoding="utf-8") as fh:
-        yaml.safe_dump({"current": "start", "inventory": ["unknown"], "language": "en"}, fh)
+        yaml_io.safe_dump({"current": "start", "inventory": ["unknown"], "language": "en"}, fh)
 
     with pytest.raises(SystemExit):
         game.Game(str(data_dir / "en" / "world.en.yaml"), "en")
@@ -32,10 +31,10 @@ def test_invalid_save_reference_leaves_file(data_dir, capsys):
 def test_invalid_npc_location_causes_error(data_dir, capsys):
     generic_world_path = data_dir / "generic" / "world.yaml"
     with open(generic_world_path, encoding="utf-8") as fh:
-        world_data = yaml.safe_load(fh)
+        world_data = yaml_io.safe_load(fh)
     world_data["npcs"]["old_man"]["meet"]["location"] = "nowhere"
     with open(generic_world_path, "w", encoding="utf-8") as fh:
-        yaml.safe_dump(world_data, fh)
+        yaml_io.safe_dump(world_data, fh)
     with pytest.raises(SystemExit):
         game.Game(str(data_dir / "en" / "world.yaml"), "en")
     out = capsys.readouterr().out
@@ -45,10 +44,10 @@ def test_invalid_npc_location_causes_error(data_dir, capsys):
 def test_missing_action_translation_warns(data_dir, io_backend):
     en_path = data_dir / "en" / "world.en.yaml"
     with open(en_path, encoding="utf-8") as fh:
-        en_world = yaml.safe_load(fh)
+        en_world = yaml_io.safe_load(fh)
     en_world["actions"].pop("cut_gem")
     with open(en_path, "w", encoding="utf-8") as fh:
-        yaml.safe_dump(en_world, fh)
+        yaml_io.safe_dump(en_world, fh)
     game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
     assert any("Missing translation for action 'cut_gem'" in o for o in io_backend.outputs)
 
@@ -77,15 +76,15 @@ def test_check_translations_reports_warnings(data_dir):
     de_dir = data_dir / "de"
     generic_dir = data_dir / "generic"
     with open(en_dir / "messages.en.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump({"farewell": "bye", "hello": "hi"}, fh)
+        yaml_io.safe_dump({"farewell": "bye", "hello": "hi"}, fh)
     with open(de_dir / "messages.de.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump({"farewell": "tschüss", "extra": "x"}, fh)
+        yaml_io.safe_dump({"farewell": "tschüss", "extra": "x"}, fh)
     with open(generic_dir / "commands.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(["go", "quit"], fh)
+        yaml_io.safe_dump(["go", "quit"], fh)
     with open(de_dir / "commands.de.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump({"go": "geh", "jump": "spring"}, fh)
+        yaml_io.safe_dump({"go": "geh", "jump": "spring"}, fh)
     with open(de_dir / "world.de.yaml", encoding="utf-8") as fh:
-        de_world = yaml.safe_load(fh)
+        de_world = yaml_io.safe_load(fh)
     de_world["items"].pop("sword")
     de_world["items"]["ghost"] = {}
     de_world["rooms"].pop("start")
@@ -93,7 +92,7 @@ def test_check_translations_reports_warnings(data_dir):
     de_world["actions"].pop("cut_gem")
     de_world["actions"]["extra"] = {}
     with open(de_dir / "world.de.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(de_world, fh)
+        yaml_io.safe_dump(de_world, fh)
     warnings = integrity.check_translations("de", data_dir)
     assert "Missing translation for message 'hello'" in warnings
     assert "Unused message translation 'extra' ignored" in warnings
@@ -1,6 +1,7 @@
 import pytest
-import yaml
+from engine import yaml_io
 from engine.world import World
+from engine.world_model import Item
 
 
 def make_world() -> World:
@@ -35,6 +36,17 @@ def test_describe_item_state_changes():
     assert w.describe_item("crown") == "A repaired crown."
 
 
+def test_item_lookup_follows_state_names():
+    w = make_world()
+    w.items["crown"].states["repaired"]["names"] = ["Shiny Crown"]
+    assert w.find_room_item("CROWN") == "crown"
+    assert w.set_item_state("crown", "repaired")
+    assert w.find_room_item("crown") is None
+    assert w.take("shiny crown") == "Shiny Crown"
+    assert w.find_room_item("shiny crown") is None
+    assert w.find_inventory_item("Shiny Crown") == "crown"
+
+
 def test_item_state_saved_and_loaded(tmp_path):
     w = make_world()
     assert w.set_item_state("crown", "repaired")
@@ -46,7 +58,7 @@ def test_item_state_saved_and_loaded(tmp_path):
     assert new.item_states["crown"] == "repaired"
     assert new.describe_item("crown") == "A repaired crown."
     with open(save_path, encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+        data = yaml_io.safe_load(fh)
     assert data["item_states"] == {"crown": "repaired"}
 
 
@@ -68,3 +80,33 @@ def test_states_from_files(data_dir, language, item_name, dull_phrase, sharp_phr
     desc = w.describe_item(item_name)
     assert desc is not None
     assert sharp_phrase in desc.lower()
+
+
+def test_world_wide_lookups(data_dir):
+    w = World.from_files(data_dir / "generic/world.yaml", data_dir / "en/world.en.yaml")
+    assert w.find_room("room 3") == "room3"
+    assert w.has_room("ROOM 2")
+    assert not w.has_room("Cellar")
+    assert w.find_npc("OLD MAN") == "old_man"
+    assert w.find_item("sword") == "sword"
+    w.items["stone"] = Item(names=["Stone"], description="A stone.")
+    assert w.find_item("stone") == "stone"
+
+
+def test_item_names_cached_per_state():
+    w = make_world()
+    w.items["crown"].states["repaired"]["names"] = ["Shiny Crown"]
+    first = w.item_names("crown")
+    assert first == ("crown",)
+    assert w.item_names("crown") is first
+    assert w.set_item_state("crown", "repaired")
+    assert w.item_names("crown") == ("Shiny Crown",)
+    assert w.item_names("missing") == ()
+
+
+def test_item_names_cf_follows_replaced_item():
+    w = make_world()
+    w.items["crown"].states["broken"]["names"] = ["Bent Crown"]
+    assert w.item_names_cf("crown") == ("bent crown",)
+    w.items["crown"] = Item(names=["crown"], state="broken", states={"broken": {"names": ["Cracked Crown"]}})
+    assert w.item_names_cf("crown") == ("cracked crown",)
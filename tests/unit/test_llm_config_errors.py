@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import pytest
-import yaml
-from engine import i18n
+from engine import i18n, yaml_io
 
 
 def _prepare_i18n(monkeypatch, data_dir):
@@ -25,7 +24,7 @@ def test_load_llm_config_missing_field(data_dir, monkeypatch, io_backend):
         "second_object_preps": ["with"],
     }
     with open(path / "llm.en.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(cfg, fh)
+        yaml_io.safe_dump(cfg, fh)
     with pytest.raises(SystemExit):
         i18n.load_llm_config("en", io_backend)
     assert any("Missing or empty fields" in o for o in io_backend.outputs)
@@ -44,7 +43,7 @@ def test_load_llm_config_empty_field(data_dir, monkeypatch, io_backend):
         "second_object_preps": ["with"],
     }
     with open(path / "llm.en.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(cfg, fh)
+        yaml_io.safe_dump(cfg, fh)
     with pytest.raises(SystemExit):
         i18n.load_llm_config("en", io_backend)
     assert any("Missing or empty fields" in o for o in io_backend.outputs)
@@ -14,3 +14,15 @@ def test_room_description_lists_items_npcs_and_exits(data_dir, io_backend):
     assert io_backend.outputs[-3] == "Room 2. Exits: Room 1, Room 3."
     assert io_backend.outputs[-2] == ""
     assert io_backend.outputs[-1] == "You see here: Gem, Old Man."
+
+
+def test_room_description_follows_world_changes(data_dir, io_backend):
+    g = game.Game(str(data_dir / "en" / "world.en.yaml"), "en", io_backend=io_backend)
+    messages = g.language_manager.messages
+    w = g.world
+    assert w.move("Room 2")
+    assert w.describe_visibility(messages) == "You see here: Gem, Old Man."
+    assert w.take("Gem")
+    assert w.describe_visibility(messages) == "You see here: Old Man."
+    w.add_exit("room2", "room2")
+    assert w.describe_room_header(messages) == "Room 2. Exits: Room 1, Room 2, Room 3."
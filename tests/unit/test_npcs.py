@@ -1,5 +1,4 @@
-import yaml
-from engine import game
+from engine import game, yaml_io
 from engine.world import World
 from engine.world_model import StateTag
 
@@ -58,6 +57,26 @@ def test_add_remove_npc_location():
     assert "old_man" not in w.rooms["room1"].occupants
 
 
+def test_move_npc_between_rooms():
+    w = make_world()
+    w.add_npc_to_location("old_man", "room1")
+    w.move_npc("old_man", "room2")
+    assert "old_man" not in w.rooms["room1"].occupants
+    assert w.rooms["room2"].occupants == ["old_man"]
+    w.apply_npc_condition({"npc": "old_man", "location": "room1"})
+    assert w.rooms["room1"].occupants == ["old_man"]
+    assert w.rooms["room2"].occupants == []
+
+
+def test_move_npc_to_current_room_is_noop():
+    w = make_world()
+    w.add_npc_to_location("old_man", "room1")
+    version = w._version
+    w.move_npc("old_man", "room1")
+    assert w.rooms["room1"].occupants == ["old_man"]
+    assert w._version == version
+
+
 def test_npc_state_saved_and_loaded(tmp_path):
     w = make_world()
     w.meet_npc("old_man")
@@ -67,7 +86,7 @@ def test_npc_state_saved_and_loaded(tmp_path):
     new.load_state(save_path)
     assert new.npc_state("old_man") == StateTag.MET
     with open(save_path, encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+        data = yaml_io.safe_load(fh)
     assert data["npc_states"] == {"old_man": "met"}
 
 
@@ -106,9 +125,9 @@ def test_npc_event_triggered_on_start(tmp_path, monkeypatch, io_backend):
         "npcs": {"old_man": {"meet": {"text": "Hello there."}}},
     }
     with open(tmp_path / "generic" / "world.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(generic, fh)
+        yaml_io.safe_dump(generic, fh)
     with open(tmp_path / "en" / "world.en.yaml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(en, fh)
+        yaml_io.safe_dump(en, fh)
 
     outputs = io_backend.outputs
     monkeypatch.setattr(io_backend, "get_input", lambda _prompt="> ": (_ for _ in ()).throw(EOFError()))
@@ -151,3 +170,13 @@ def test_action_requires_multiple_npc_conditions():
     w.meet_npc("old_man")
     w.set_npc_state("old_woman", StateTag.HELPED)
     assert w.check_preconditions(pre)
+
+
+def test_npc_state_tags_are_saved_as_plain_strings(tmp_path):
+    w = make_world()
+    assert w.set_npc_state("old_woman", StateTag.HELPED)
+    assert w.npc_state("old_woman") == "helped"
+    save_path = tmp_path / "save.yaml"
+    w.save(save_path)
+    with open(save_path, encoding="utf-8") as fh:
+        assert yaml_io.safe_load(fh)["npc_states"] == {"old_woman": "helped"}
@@ -0,0 +1,52 @@
+from engine.world import World, _compile_preconditions, _fuse_checks, _never
+
+
+def make_world() -> World:
+    data = {
+        "items": {"gem": {"names": ["gem"], "states": {"red": {}, "green": {}}, "state": "red"}},
+        "rooms": {
+            "start": {"names": ["Start"], "description": "Start.", "items": ["gem"], "exits": ["hall"]},
+            "hall": {"names": ["Hall"], "description": "Hall."},
+        },
+        "start": "start",
+    }
+    return World(data)
+
+
+def test_unsatisfiable_checks_run_first():
+    checks = _compile_preconditions({"is_location": "start", "item_conditions": [{"state": "red"}]})
+    assert checks[0] is _never
+    assert len(checks) == 2
+
+
+def test_reordered_checks_keep_meaning():
+    w = make_world()
+    pre = {
+        "item_conditions": [{"item": "gem", "location": "start"}, {"item": "gem", "state": "red"}],
+        "is_location": "start",
+    }
+    assert w.check_preconditions(pre)
+    w.set_item_state("gem", "green")
+    assert not w.check_preconditions(pre)
+    w.set_item_state("gem", "red")
+    assert w.move("Hall")
+    assert not w.check_preconditions(pre)
+
+
+def test_fused_checks_short_circuit_in_order():
+    calls = []
+
+    def make(name, result):
+        def check(_w):
+            calls.append(name)
+            return result
+
+        return check
+
+    w = make_world()
+    assert _fuse_checks(())(w)
+    assert _fuse_checks((make("a", True), make("b", True), make("c", True)))(w)
+    assert calls == ["a", "b", "c"]
+    calls.clear()
+    assert not _fuse_checks((make("a", True), make("b", False), make("c", True)))(w)
+    assert calls == ["a", "b"]
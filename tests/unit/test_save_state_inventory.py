@@ -1,4 +1,4 @@
-import yaml
+from engine import yaml_io
 from engine.world import World
 
 
@@ -80,6 +80,30 @@ def test_load_state_applies_differences(tmp_path):
     assert new.rooms["room2"].get("items", []) == []
     assert new.rooms["room3"].get("items", []) == ["crown", "sword"]
     with open(save_path, encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+        data = yaml_io.safe_load(fh)
     assert "inventory" not in data
     assert data["rooms"] == {"room2": [], "room3": ["crown", "sword"]}
+
+
+def test_save_rewrites_unchanged_world(tmp_path):
+    w = make_world()
+    save_path = tmp_path / "save.yaml"
+    w.save(save_path)
+    save_path.write_text("marker: 1\n", encoding="utf-8")
+    w.save(save_path)
+    assert yaml_io.safe_load(save_path.read_text(encoding="utf-8")) == w.to_state()
+    w.move("Room 2")
+    w.take("sword")
+    w.save(save_path)
+    assert yaml_io.safe_load(save_path.read_text(encoding="utf-8"))["inventory"] == ["sword"]
+
+
+def test_to_state_drops_reverted_differences():
+    w = make_world()
+    w.move("Room 2")
+    w.take("sword")
+    first = w.to_state()
+    assert first == {"current": "room2", "inventory": ["sword"], "rooms": {"room2": []}}
+    w.drop("sword")
+    assert w.to_state() == {"current": "room2"}
+    assert first["rooms"] == {"room2": []}
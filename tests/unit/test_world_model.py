@@ -46,3 +46,15 @@ def test_action_dataclass():
     assert action.trigger == "use"
     assert action.item == "key"
     assert action.messages["success"] == "opened"
+
+
+def test_names_cf_is_casefolded():
+    item = Item(names=["Straße", "KEY"])
+    assert item.names_cf == ("strasse", "key")
+    assert "names_cf" not in item.model_dump()
+
+
+def test_names_cf_share_interned_strings():
+    room = Room(names=["Great Hall"], description="")
+    npc = Npc(names=["GREAT HALL".lower()])
+    assert room.names_cf[0] is npc.names_cf[0]
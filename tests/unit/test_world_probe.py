@@ -0,0 +1,15 @@
+from engine.world import World
+
+
+def test_probe_reads_header_only(tmp_path):
+    path = tmp_path / "world.yaml"
+    path.write_text("__world__: demo\nversion: 2\n\nrooms: [unclosed\n", encoding="utf-8")
+    assert World.probe(path) == {"__world__": "demo", "version": 2}
+
+
+def test_probe_rejects_non_mapping_header(tmp_path):
+    path = tmp_path / "world.yaml"
+    path.write_text("- a\n- b\n", encoding="utf-8")
+    assert World.probe(path) is None
+    path.write_text("\nstart: room\n", encoding="utf-8")
+    assert World.probe(path) is None
@@ -0,0 +1,116 @@
+import json
+import os
+
+from engine import yaml_io
+from engine.world import World
+
+
+def _counting_build(calls: list[int]):
+    def build() -> dict:
+        calls.append(1)
+        return {"start": "hut"}
+
+    return build
+
+
+def test_cached_reuses_result_until_sources_change(tmp_path):
+    source = tmp_path / "world.yaml"
+    source.write_text("start: hut\n", encoding="utf-8")
+    cache_path = tmp_path / "world.pkl"
+    calls: list[int] = []
+    build = _counting_build(calls)
+    assert yaml_io.cached(cache_path, (source,), build) == {"start": "hut"}
+    assert cache_path.exists()
+
+    first = yaml_io.cached(cache_path, (source,), build)
+    first["start"] = "changed"
+    assert yaml_io.cached(cache_path, (source,), build) == {"start": "hut"}
+    assert len(calls) == 1
+
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert yaml_io.cached(cache_path, (source,), build) == {"start": "hut"}
+    assert len(calls) == 2
+
+
+def test_cached_rebuilds_when_version_changes(tmp_path):
+    source = tmp_path / "world.yaml"
+    source.write_text("start: hut\n", encoding="utf-8")
+    cache_path = tmp_path / "world.pkl"
+    calls: list[int] = []
+    build = _counting_build(calls)
+    yaml_io.cached(cache_path, (source,), build, version="1")
+    yaml_io.cached(cache_path, (source,), build, version="1")
+    assert yaml_io.cached(cache_path, (source,), build, version="2") == {"start": "hut"}
+    assert calls == [1, 1]
+
+
+def test_cached_rebuilds_on_corrupt_cache(tmp_path):
+    source = tmp_path / "world.yaml"
+    source.write_text("start: hut\n", encoding="utf-8")
+    cache_path = tmp_path / "world.pkl"
+    cache_path.write_bytes(b"not a pickle")
+    calls: list[int] = []
+    assert yaml_io.cached(cache_path, (source,), _counting_build(calls)) == {"start": "hut"}
+    assert calls == [1]
+
+
+def test_cached_returns_data_when_cache_is_unwritable(tmp_path):
+    source = tmp_path / "world.yaml"
+    source.write_text("start: hut\n", encoding="utf-8")
+    cache_path = source / "world.pkl"  # parent is a file, so writing must fail
+    calls: list[int] = []
+    build = _counting_build(calls)
+    assert yaml_io.cached(cache_path, (source,), build) == {"start": "hut"}
+    assert yaml_io.cached(cache_path, (source,), build) == {"start": "hut"}
+    assert calls == [1, 1]
+
+
+def test_save_round_trip_is_json_and_reads_legacy_yaml(tmp_path):
+    path = tmp_path / "save.yaml"
+    data = {"current": "hütte", "inventory": ["sword"], "time": 5}
+    yaml_io.dump_save(data, path)
+    assert json.loads(path.read_text(encoding="utf-8")) == data
+    assert yaml_io.load_save(path) == data
+    path.write_text("current: hut\ninventory:\n- sword\n", encoding="utf-8")
+    assert yaml_io.load_save(path) == {"current": "hut", "inventory": ["sword"]}
+
+
+def test_cached_checks_header_before_unpickling(tmp_path):
+    source = tmp_path / "world.yaml"
+    source.write_text("start: hut\n", encoding="utf-8")
+    cache_path = tmp_path / "world.pkl"
+    # A stale header must not let the payload be unpickled; this payload would fail if it were
+    cache_path.write_bytes(b'[0, "", []]\n' + b"cbuiltins\nexit\n(tR.")
+    calls: list[int] = []
+    assert yaml_io.cached(cache_path, (source,), _counting_build(calls)) == {"start": "hut"}
+    assert calls == [1]
+
+
+def test_from_files_cache_follows_translation_changes(data_dir, tmp_path, monkeypatch):
+    monkeypatch.setenv("HDA_CACHE_DIR", str(tmp_path / "cache"))
+    generic = data_dir / "generic" / "world.yaml"
+    lang = data_dir / "en" / "world.en.yaml"
+    first = World.from_files(generic, lang)
+    assert len(list((tmp_path / "cache").glob("world.en.yaml.*.world.pkl"))) == 1
+    assert not list((data_dir / "en").glob("*.pkl"))
+    second = World.from_files(generic, lang)
+    assert second.rooms["start"].names == first.rooms["start"].names
+    assert second.rooms["start"] is not first.rooms["start"]
+
+    text = lang.read_text(encoding="utf-8").replace("Room 2", "Hall")
+    lang.write_text(text, encoding="utf-8")
+    st = lang.stat()
+    os.utime(lang, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert World.from_files(generic, lang).rooms["room2"].names == ["Hall"]
+
+
+def test_from_files_cache_interns_exit_names(data_dir):
+    generic = data_dir / "generic" / "world.yaml"
+    lang = data_dir / "en" / "world.en.yaml"
+    cold = World.from_files(generic, lang)
+    warm = World.from_files(generic, lang)
+    for room_id, room in warm.rooms.items():
+        for target, cfg in room.exits.items():
+            cold_names_cf = cold.rooms[room_id].exits[target]["names_cf"]
+            assert all(a is b for a, b in zip(cfg["names_cf"], cold_names_cf, strict=True))